@@ -1,5 +1,7 @@
-from typing import Dict, Any
-from fastapi import APIRouter, HTTPException, status
+from typing import Dict, Any, List
+from fastapi import APIRouter, HTTPException, Query, status
+from app.core.config import settings
+from app.models.schemas import CacheWarmRequest
 from app.services.cache_service import cache_service
 import logging
 
@@ -7,6 +9,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# INFO sections that may be requested through the snapshot endpoint
+SNAPSHOT_SECTIONS = {"server", "clients", "memory", "stats", "keyspace"}
+
 
 @router.get("/stats")
 async def get_cache_stats():
@@ -22,6 +27,28 @@ async def get_cache_stats():
         )
 
 
+@router.get("/snapshot")
+async def get_cache_snapshot(
+    sections: List[str] = Query(["memory", "stats"], description="INFO sections to include")
+):
+    """Get the key count and selected INFO sections from a single pipelined probe"""
+    unknown_sections = set(sections) - SNAPSHOT_SECTIONS
+    if unknown_sections:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown cache sections: {', '.join(sorted(unknown_sections))}"
+        )
+    
+    try:
+        return cache_service.get_cache_snapshot(sections)
+    except Exception as e:
+        logger.error(f"Error getting cache snapshot: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+
 @router.delete("/users/{user_id}")
 async def invalidate_user_cache(user_id: str):
     """Invalidate all cache entries for a specific user"""
@@ -73,6 +100,29 @@ async def flush_all_cache():
         )
 
 
+@router.post("/_test/warm", include_in_schema=False)
+async def warm_cache(request: CacheWarmRequest):
+    """Populate placeholder cache entries in one round trip (test environments only)"""
+    if not settings.ENABLE_TEST_ENDPOINTS:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    
+    try:
+        warmed_count = cache_service.set_many(
+            {key: {"warmed": True} for key in request.keys},
+            ttl=request.ttl
+        )
+        return {
+            "warmed_entries": warmed_count,
+            "stats": cache_service.get_cache_stats()
+        }
+    except Exception as e:
+        logger.error(f"Error warming cache: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error"
+        )
+
+
 @router.get("/health")
 async def cache_health_check():
     """Check cache service health"""
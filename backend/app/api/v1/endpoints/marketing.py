@@ -1,5 +1,6 @@
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.services.marketing_service import marketing_service
@@ -10,12 +11,38 @@ from app.models.schemas import (
     VisionBoardRequest, VisionBoard
 )
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+# Templates, template types, themes and styles are fixed for the life of the
+# process, so their response bodies are serialized once and reused
+@lru_cache(maxsize=1)
+def _email_templates_body() -> bytes:
+    templates = marketing_service.get_available_templates()
+    return orjson.dumps([template.model_dump(mode="json") for template in templates])
+
+
+@lru_cache(maxsize=1)
+def _email_template_types_body() -> bytes:
+    return orjson.dumps({
+        "template_types": [template_type.value for template_type in EmailTemplateType]
+    })
+
+
+@lru_cache(maxsize=1)
+def _vision_board_themes_body() -> bytes:
+    return orjson.dumps({"themes": vision_board_service.get_vision_board_themes()})
+
+
+@lru_cache(maxsize=1)
+def _vision_board_styles_body() -> bytes:
+    return orjson.dumps({"styles": vision_board_service.get_style_options()})
+
+
 @router.post("/emails/generate", response_model=GeneratedEmail)
 async def generate_personalized_email(
     request: PersonalizedEmailRequest,
@@ -52,8 +79,7 @@ async def generate_personalized_email(
 async def get_email_templates():
     """Get available email templates"""
     try:
-        templates = marketing_service.get_available_templates()
-        return templates
+        return Response(content=_email_templates_body(), media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting email templates: {e}")
         raise HTTPException(
@@ -87,9 +113,7 @@ async def preview_email_template(
 @router.get("/emails/template-types")
 async def get_email_template_types():
     """Get available email template types"""
-    return {
-        "template_types": [template_type.value for template_type in EmailTemplateType]
-    }
+    return Response(content=_email_template_types_body(), media_type="application/json")
 
 
 @router.post("/vision-boards/generate", response_model=VisionBoard)
@@ -128,8 +152,7 @@ async def generate_vision_board(
 async def get_vision_board_themes():
     """Get available vision board themes"""
     try:
-        themes = vision_board_service.get_vision_board_themes()
-        return {"themes": themes}
+        return Response(content=_vision_board_themes_body(), media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting vision board themes: {e}")
         raise HTTPException(
@@ -142,8 +165,7 @@ async def get_vision_board_themes():
 async def get_vision_board_styles():
     """Get available vision board style options"""
     try:
-        styles = vision_board_service.get_style_options()
-        return {"styles": styles}
+        return Response(content=_vision_board_styles_body(), media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting vision board styles: {e}")
         raise HTTPException(
@@ -170,11 +192,12 @@ async def create_email_campaign(
         results = []
         failed_users = []
         
+        # Verify all users exist with one query
+        existing_user_ids = {user.id for user in user_data_service.get_users_by_ids(db, user_ids)}
+        
         for user_id in user_ids:
             try:
-                # Verify user exists
-                user = user_data_service.get_user_by_id(db, user_id)
-                if not user:
+                if user_id not in existing_user_ids:
                     failed_users.append({"user_id": user_id, "reason": "User not found"})
                     continue
                 
@@ -1,5 +1,7 @@
 from typing import List, Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.services.product_service import product_service
@@ -12,14 +14,35 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.post("/", response_model=Product, status_code=status.HTTP_201_CREATED)
+# The body is parsed by hand, so its schema is declared for the OpenAPI docs explicitly
+@router.post(
+    "/",
+    response_model=Product,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": ProductCreate.model_json_schema()}}
+        }
+    }
+)
 async def create_product(
-    product_data: ProductCreate,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """Create a new product"""
+    # Validate the raw body straight from JSON; the service takes the model as-is
+    # instead of FastAPI binding it and the service validating a dict copy again
+    try:
+        product_data = ProductCreate.model_validate_json(await request.body())
+    except PydanticValidationError as e:
+        # Same 422 shape FastAPI produces for a bound body
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+    
     try:
-        product = product_service.create_product(db, product_data.dict())
+        product = product_service.create_product(db, product_data)
         return product
     except ValidationError as e:
         raise HTTPException(
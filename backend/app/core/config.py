@@ -44,6 +44,7 @@ class Settings(BaseSettings):
     # Development Settings
     DEBUG: bool = True
     LOG_LEVEL: str = "INFO"
+    ENABLE_TEST_ENDPOINTS: bool = False  # Exposes test-only helpers such as cache warming
     
     class Config:
         env_file = ".env"
@@ -1,9 +1,17 @@
 from typing import List, Dict, Any
+from pydantic import TypeAdapter
 from app.models.schemas import (
     UserCreate, ProductCreate, PurchaseCreate, 
     UserInterestCreate, UserDataIngestion
 )
 
+# Adapters are built once at import and reused by the validate_* helpers below
+_USER_ADAPTER = TypeAdapter(UserCreate)
+_PRODUCT_ADAPTER = TypeAdapter(ProductCreate)
+_PURCHASE_ADAPTER = TypeAdapter(PurchaseCreate)
+_INTEREST_ADAPTER = TypeAdapter(UserInterestCreate)
+_BULK_USER_ADAPTER = TypeAdapter(UserDataIngestion)
+
 
 class ValidationError(Exception):
     """Custom validation error"""
@@ -16,7 +24,7 @@ class ValidationError(Exception):
 def validate_user_data(user_data: Dict[str, Any]) -> UserCreate:
     """Validate and create User object from raw data"""
     try:
-        return UserCreate(**user_data)
+        return _USER_ADAPTER.validate_python(user_data)
     except Exception as e:
         raise ValidationError(f"Invalid user data: {str(e)}")
 
@@ -24,7 +32,7 @@ def validate_user_data(user_data: Dict[str, Any]) -> UserCreate:
 def validate_product_data(product_data: Dict[str, Any]) -> ProductCreate:
     """Validate and create Product object from raw data"""
     try:
-        return ProductCreate(**product_data)
+        return _PRODUCT_ADAPTER.validate_python(product_data)
     except Exception as e:
         raise ValidationError(f"Invalid product data: {str(e)}")
 
@@ -32,7 +40,7 @@ def validate_product_data(product_data: Dict[str, Any]) -> ProductCreate:
 def validate_purchase_data(purchase_data: Dict[str, Any]) -> PurchaseCreate:
     """Validate and create Purchase object from raw data"""
     try:
-        return PurchaseCreate(**purchase_data)
+        return _PURCHASE_ADAPTER.validate_python(purchase_data)
     except Exception as e:
         raise ValidationError(f"Invalid purchase data: {str(e)}")
 
@@ -40,7 +48,7 @@ def validate_purchase_data(purchase_data: Dict[str, Any]) -> PurchaseCreate:
 def validate_interest_data(interest_data: Dict[str, Any]) -> UserInterestCreate:
     """Validate and create UserInterest object from raw data"""
     try:
-        return UserInterestCreate(**interest_data)
+        return _INTEREST_ADAPTER.validate_python(interest_data)
     except Exception as e:
         raise ValidationError(f"Invalid interest data: {str(e)}")
 
@@ -48,7 +56,7 @@ def validate_interest_data(interest_data: Dict[str, Any]) -> UserInterestCreate:
 def validate_bulk_user_data(data: Dict[str, Any]) -> UserDataIngestion:
     """Validate bulk user data ingestion"""
     try:
-        return UserDataIngestion(**data)
+        return _BULK_USER_ADAPTER.validate_python(data)
     except Exception as e:
         raise ValidationError(f"Invalid bulk user data: {str(e)}")
 
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict, Any
+from pydantic import AliasChoices, BaseModel, BeforeValidator, Field, validator
+from typing import Annotated, List, Literal, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
 
@@ -29,6 +29,25 @@ class ProductCategory(str, Enum):
     SPORTS_OUTDOORS = "sports_outdoors"
 
 
+def _enum_value(value: Any) -> Any:
+    """Unwrap an Enum member so Literal fields also accept the enum constants"""
+    return value.value if isinstance(value, Enum) else value
+
+
+# Plain-string category types for the hot write/scoring schemas. pydantic-core
+# checks a Literal natively, while an Enum field goes through the Enum
+# constructor; the enums above remain the named constants.
+InterestCategoryLiteral = Annotated[
+    Literal[tuple(category.value for category in InterestCategory)],
+    BeforeValidator(_enum_value)
+]
+
+ProductCategoryLiteral = Annotated[
+    Literal[tuple(category.value for category in ProductCategory)],
+    BeforeValidator(_enum_value)
+]
+
+
 class UserBase(BaseModel):
     email: str = Field(..., description="User email address")
     full_name: Optional[str] = Field(None, max_length=100, description="User's full name")
@@ -125,11 +144,17 @@ class ProductBase(BaseModel):
 
 
 class ProductCreate(ProductBase):
-    pass
+    category: ProductCategoryLiteral = Field(..., description="Product category")
 
 
 class Product(ProductBase):
     id: str = Field(..., description="Unique product identifier")
+    # ProductModel stores this as extra_data; its own metadata attribute is SQLAlchemy's MetaData
+    metadata: Dict[str, Any] = Field(
+        default_factory=dict,
+        validation_alias=AliasChoices("extra_data", "metadata"),
+        description="Additional product metadata"
+    )
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
     class Config:
@@ -177,7 +202,7 @@ class UserInterestBase(BaseModel):
 
 
 class UserInterestCreate(UserInterestBase):
-    pass
+    interest_category: InterestCategoryLiteral = Field(..., description="Category of interest")
 
 
 class UserInterest(UserInterestBase):
@@ -192,7 +217,7 @@ class RecommendationBase(BaseModel):
     product_id: str = Field(..., description="Recommended product ID")
     score: float = Field(..., ge=0.0, le=1.0, description="Recommendation score (0-1)")
     reason: str = Field(..., description="Reason for recommendation")
-    category: ProductCategory = Field(..., description="Product category")
+    category: ProductCategoryLiteral = Field(..., description="Product category")
     
     @validator('score')
     def validate_score(cls, v):
@@ -282,4 +307,10 @@ class VisionBoard(BaseModel):
     products: List[Product] = Field(..., description="Products included in vision board")
     layout_data: Dict[str, Any] = Field(..., description="Layout configuration data")
     style_config: Dict[str, Any] = Field(..., description="Style configuration")
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
\ No newline at end of file
+    generated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class CacheWarmRequest(BaseModel):
+    """Cache keys to populate in one pipeline (test environments only)"""
+    keys: List[str] = Field(..., min_length=1, max_length=100, description="Cache keys to populate")
+    ttl: int = Field(300, gt=0, description="Time to live in seconds")
@@ -65,7 +65,7 @@ class ProductRepository(BaseRepository[ProductModel]):
         """Create a new product"""
         product_data = {
             "name": product.name,
-            "category": product.category.value,
+            "category": product.category,
             "price": product.price,
             "description": product.description,
             "image_url": product.image_url,
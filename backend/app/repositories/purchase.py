@@ -1,7 +1,7 @@
 from typing import Optional, List
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import desc
+from sqlalchemy import desc, func, insert, select
 from app.repositories.base import BaseRepository
 from app.models.database import PurchaseModel
 from app.models.schemas import PurchaseCreate
@@ -16,16 +16,36 @@ class PurchaseRepository(BaseRepository[PurchaseModel]):
     def __init__(self):
         super().__init__(PurchaseModel)
     
-    def create_purchase(self, db: Session, purchase: PurchaseCreate) -> PurchaseModel:
-        """Create a new purchase"""
-        purchase_data = {
+    @staticmethod
+    def _purchase_row(purchase: PurchaseCreate) -> dict:
+        """Map a purchase schema onto PurchaseModel columns"""
+        return {
             "user_id": purchase.user_id,
             "product_id": purchase.product_id,
             "amount": purchase.amount,
             "quantity": purchase.quantity,
             "extra_data": purchase.metadata
         }
-        return self.create(db, purchase_data)
+    
+    def create_purchase(self, db: Session, purchase: PurchaseCreate) -> PurchaseModel:
+        """Create a new purchase"""
+        return self.create(db, self._purchase_row(purchase))
+    
+    def bulk_create_purchases(self, db: Session, purchases: List[PurchaseCreate]) -> List[str]:
+        """Create many purchases with a single INSERT and return their ids"""
+        if not purchases:
+            return []
+        
+        try:
+            rows = [self._purchase_row(purchase) for purchase in purchases]
+            purchase_ids = db.scalars(insert(PurchaseModel).returning(PurchaseModel.id), rows).all()
+            db.commit()
+            logger.info(f"Created {len(purchase_ids)} purchases in bulk")
+            return list(purchase_ids)
+        except SQLAlchemyError as e:
+            logger.error(f"Error bulk creating purchases: {e}")
+            db.rollback()
+            raise
     
     def get_by_user_id(self, db: Session, user_id: str, limit: int = 100) -> List[PurchaseModel]:
         """Get all purchases for a user"""
@@ -58,13 +78,12 @@ class PurchaseRepository(BaseRepository[PurchaseModel]):
     def get_user_total_spent(self, db: Session, user_id: str) -> float:
         """Get total amount spent by a user"""
         try:
-            from sqlalchemy import func
-            result = (
-                db.query(func.sum(PurchaseModel.amount))
-                .filter(PurchaseModel.user_id == user_id)
-                .scalar()
+            # COALESCE keeps users without purchases at 0 inside the single aggregate query
+            result = db.scalar(
+                select(func.coalesce(func.sum(PurchaseModel.amount), 0.0))
+                .where(PurchaseModel.user_id == user_id)
             )
-            return float(result) if result else 0.0
+            return float(result)
         except SQLAlchemyError as e:
             logger.error(f"Error calculating total spent for user {user_id}: {e}")
             raise
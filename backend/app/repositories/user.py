@@ -15,6 +15,17 @@ class UserRepository(BaseRepository[UserModel]):
     def __init__(self):
         super().__init__(UserModel)
     
+    def get_by_ids(self, db: Session, user_ids: List[str]) -> List[UserModel]:
+        """Get all users whose ID is in user_ids with a single query"""
+        if not user_ids:
+            return []
+        
+        try:
+            return db.query(UserModel).filter(UserModel.id.in_(user_ids)).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting {len(user_ids)} users by id: {e}")
+            raise
+    
     def get_by_email(self, db: Session, email: str) -> Optional[UserModel]:
         """Get user by email address"""
         try:
@@ -65,7 +65,7 @@ class UserInterestRepository(BaseRepository[UserInterestModel]):
         """Create a new user interest"""
         interest_data = {
             "user_id": interest.user_id,
-            "interest_category": interest.interest_category.value,
+            "interest_category": interest.interest_category,
             "interest_value": interest.interest_value,
             "confidence_score": interest.confidence_score,
             "source": interest.source
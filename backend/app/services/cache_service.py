@@ -59,6 +59,24 @@ class CacheService:
             logger.error(f"Error setting cache key {key}: {e}")
             return False
     
+    def set_many(self, entries: Dict[str, Any], ttl: int = 3600) -> int:
+        """Set several values with the same TTL in one pipeline; returns how many were set"""
+        if not self.redis_client:
+            logger.warning(f"Redis not available, skipping cache set for {len(entries)} keys")
+            return 0
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, value in entries.items():
+                if isinstance(value, (dict, list)):
+                    pipe.setex(key, ttl, json.dumps(value, default=str))
+                else:
+                    pipe.setex(key, ttl, pickle.dumps(value))
+            return sum(bool(result) for result in pipe.execute())
+        except Exception as e:
+            logger.error(f"Error setting {len(entries)} cache keys: {e}")
+            return 0
+    
     def get(self, key: str) -> Optional[Any]:
         """Get a value from cache"""
         if not self.redis_client:
@@ -213,7 +231,13 @@ class CacheService:
             return {"status": "disconnected"}
         
         try:
-            info = self.redis_client.info()
+            # Only the sections read below, in one round trip; full INFO is much larger
+            pipe = self.redis_client.pipeline(transaction=False)
+            for section in ("memory", "clients", "stats", "keyspace"):
+                pipe.info(section)
+            info = {}
+            for section_info in pipe.execute():
+                info.update(section_info)
             return {
                 "status": "connected",
                 "used_memory": info.get("used_memory_human", "N/A"),
@@ -229,6 +253,26 @@ class CacheService:
         except Exception as e:
             logger.error(f"Error getting cache stats: {e}")
             return {"status": "error", "error": str(e)}
+    
+    def get_cache_snapshot(self, sections: List[str]) -> Dict[str, Any]:
+        """Get the key count and the requested INFO sections in one round trip"""
+        if not self.redis_client:
+            return {"status": "disconnected"}
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.dbsize()
+            for section in sections:
+                pipe.info(section)
+            key_count, *section_infos = pipe.execute()
+            return {
+                "status": "connected",
+                "key_count": key_count,
+                "sections": dict(zip(sections, section_infos))
+            }
+        except Exception as e:
+            logger.error(f"Error getting cache snapshot: {e}")
+            return {"status": "error", "error": str(e)}
 
 
 # Create service instance
@@ -1,5 +1,6 @@
-from typing import List, Dict, Any, Optional
-from neo4j import GraphDatabase, Driver
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Iterator
+from neo4j import GraphDatabase, Driver, Session
 from app.core.config import settings
 from app.models.schemas import User, Product, Purchase, UserInterest, Recommendation
 import logging
@@ -34,6 +35,15 @@ class KnowledgeGraphService:
         if self.driver:
             self.driver.close()
     
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        """Yield a session backed by the driver's connection pool"""
+        if not self.driver:
+            raise RuntimeError("Neo4j driver not available")
+        
+        with self.driver.session() as session:
+            yield session
+    
     def create_user_node(self, user: User) -> bool:
         """Create or update user node in the knowledge graph"""
         if not self.driver:
@@ -171,6 +181,119 @@ class KnowledgeGraphService:
             logger.error(f"Error creating interest relationship for {interest.id}: {e}")
             return False
     
+    # Bulk writers: run a single UNWIND statement on a caller-supplied
+    # session or transaction so several batches can share one connection.
+    
+    def create_user_nodes_bulk(self, tx, users: List[User]) -> int:
+        """Create or update user nodes in one UNWIND statement"""
+        query = """
+        UNWIND $rows AS row
+        MERGE (u:User {id: row.user_id})
+        SET u.email = row.email,
+            u.profile_data = row.profile_data,
+            u.created_at = row.created_at,
+            u.updated_at = row.updated_at
+        RETURN count(u) AS total
+        """
+        rows = [
+            {
+                "user_id": user.id,
+                "email": user.email,
+                "profile_data": user.profile_data,
+                "created_at": user.created_at.isoformat(),
+                "updated_at": user.updated_at.isoformat()
+            }
+            for user in users
+        ]
+        return tx.run(query, {"rows": rows}).single()["total"]
+    
+    def create_product_nodes_bulk(self, tx, products: List[Product]) -> int:
+        """Create or update product nodes in one UNWIND statement"""
+        query = """
+        UNWIND $rows AS row
+        MERGE (p:Product {id: row.product_id})
+        SET p.name = row.name,
+            p.category = row.category,
+            p.price = row.price,
+            p.description = row.description,
+            p.image_url = row.image_url,
+            p.metadata = row.metadata,
+            p.created_at = row.created_at
+        RETURN count(p) AS total
+        """
+        rows = [
+            {
+                "product_id": product.id,
+                "name": product.name,
+                "category": product.category.value,
+                "price": product.price,
+                "description": product.description,
+                "image_url": product.image_url,
+                "metadata": product.metadata,
+                "created_at": product.created_at.isoformat()
+            }
+            for product in products
+        ]
+        return tx.run(query, {"rows": rows}).single()["total"]
+    
+    def create_purchase_relationships_bulk(self, tx, purchases: List[Purchase]) -> int:
+        """Create purchase relationships in one UNWIND statement"""
+        query = """
+        UNWIND $rows AS row
+        MATCH (u:User {id: row.user_id})
+        MATCH (p:Product {id: row.product_id})
+        CREATE (u)-[r:PURCHASED {
+            purchase_id: row.purchase_id,
+            amount: row.amount,
+            quantity: row.quantity,
+            timestamp: row.timestamp,
+            metadata: row.metadata
+        }]->(p)
+        RETURN count(r) AS total
+        """
+        rows = [
+            {
+                "user_id": purchase.user_id,
+                "product_id": purchase.product_id,
+                "purchase_id": purchase.id,
+                "amount": purchase.amount,
+                "quantity": purchase.quantity,
+                "timestamp": purchase.timestamp.isoformat(),
+                "metadata": purchase.metadata
+            }
+            for purchase in purchases
+        ]
+        return tx.run(query, {"rows": rows}).single()["total"]
+    
+    def create_interest_relationships_bulk(self, tx, interests: List[UserInterest]) -> int:
+        """Create interest relationships in one UNWIND statement"""
+        query = """
+        UNWIND $rows AS row
+        MERGE (ic:InterestCategory {name: row.category})
+        WITH row, ic
+        MATCH (u:User {id: row.user_id})
+        MERGE (iv:InterestValue {value: row.interest_value, category: row.category})
+        CREATE (u)-[r:INTERESTED_IN {
+            confidence_score: row.confidence_score,
+            source: row.source,
+            created_at: row.created_at
+        }]->(iv)
+        CREATE (iv)-[:BELONGS_TO]->(ic)
+        RETURN count(r) AS total
+        """
+        rows = [
+            {
+                "user_id": interest.user_id,
+                "category": interest.interest_category.value,
+                "interest_value": interest.interest_value,
+                "confidence_score": interest.confidence_score,
+                "source": interest.source,
+                "created_at": interest.created_at.isoformat()
+            }
+            for interest in interests
+        ]
+        return tx.run(query, {"rows": rows}).single()["total"]
+    
     def get_user_recommendations(self, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get product recommendations for a user based on knowledge graph"""
         if not self.driver:
@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from sqlalchemy.orm import Session
 from app.repositories.product import product_repository
 from app.models.schemas import Product, ProductCreate, ProductCategory
@@ -14,10 +14,14 @@ class ProductService:
     def __init__(self):
         self.product_repo = product_repository
     
-    def create_product(self, db: Session, product_data: Dict[str, Any]) -> Product:
-        """Create a new product with validation"""
+    def create_product(self, db: Session, product_data: Union[ProductCreate, Dict[str, Any]]) -> Product:
+        """Create a new product, validating raw data first"""
         try:
-            validated_product = validate_product_data(product_data)
+            # Already-validated models (e.g. from the API layer) are not validated again
+            if isinstance(product_data, ProductCreate):
+                validated_product = product_data
+            else:
+                validated_product = validate_product_data(product_data)
             db_product = self.product_repo.create_product(db, validated_product)
             logger.info(f"Created product: {db_product.name}")
             return Product.model_validate(db_product)
@@ -53,6 +53,14 @@ class UserDataService:
             logger.error(f"Error getting user by ID {user_id}: {e}")
             raise
     
+    def get_users_by_ids(self, db: Session, user_ids: List[str]) -> List[User]:
+        """Get the existing users among user_ids"""
+        try:
+            return [User.model_validate(db_user) for db_user in self.user_repo.get_by_ids(db, user_ids)]
+        except Exception as e:
+            logger.error(f"Error getting users by IDs: {e}")
+            raise
+    
     def get_user_by_email(self, db: Session, email: str) -> Optional[User]:
         """Get user by email"""
         try:
@@ -31,7 +31,7 @@ class UserInterestService:
             existing_interest = self.interest_repo.find_duplicate_interest(
                 db, 
                 validated_interest.user_id,
-                validated_interest.interest_category.value,
+                validated_interest.interest_category,
                 validated_interest.interest_value
             )
             
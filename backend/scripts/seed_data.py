@@ -24,6 +24,9 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Map stored category strings back to enums for the knowledge graph phase
+INTEREST_CATEGORY_BY_VALUE = {category.value: category for category in InterestCategory}
+
 
 def create_sample_users() -> list:
     """Create sample users"""
@@ -219,29 +222,29 @@ def create_sample_interests() -> list:
     """Create sample user interests"""
     interests = [
         # Alice's interests (tech-savvy fitness enthusiast)
-        {"category": InterestCategory.TECHNOLOGY, "value": "smart_home_devices", "confidence": 0.9, "source": "purchase"},
-        {"category": InterestCategory.FITNESS, "value": "yoga", "confidence": 0.8, "source": "survey"},
-        {"category": InterestCategory.FITNESS, "value": "running", "confidence": 0.7, "source": "behavior"},
+        {"category": InterestCategory.TECHNOLOGY.value, "value": "smart_home_devices", "confidence": 0.9, "source": "purchase"},
+        {"category": InterestCategory.FITNESS.value, "value": "yoga", "confidence": 0.8, "source": "survey"},
+        {"category": InterestCategory.FITNESS.value, "value": "running", "confidence": 0.7, "source": "behavior"},
         
         # Bob's interests (fashion and travel)
-        {"category": InterestCategory.FASHION, "value": "luxury_brands", "confidence": 0.9, "source": "purchase"},
-        {"category": InterestCategory.TRAVEL, "value": "international_destinations", "confidence": 0.8, "source": "survey"},
-        {"category": InterestCategory.FASHION, "value": "designer_clothing", "confidence": 0.85, "source": "behavior"},
+        {"category": InterestCategory.FASHION.value, "value": "luxury_brands", "confidence": 0.9, "source": "purchase"},
+        {"category": InterestCategory.TRAVEL.value, "value": "international_destinations", "confidence": 0.8, "source": "survey"},
+        {"category": InterestCategory.FASHION.value, "value": "designer_clothing", "confidence": 0.85, "source": "behavior"},
         
         # Carol's interests (home and books)
-        {"category": InterestCategory.HOME, "value": "kitchen_gadgets", "confidence": 0.8, "source": "purchase"},
-        {"category": InterestCategory.BOOKS, "value": "self_improvement", "confidence": 0.9, "source": "purchase"},
-        {"category": InterestCategory.FOOD, "value": "healthy_cooking", "confidence": 0.7, "source": "behavior"},
+        {"category": InterestCategory.HOME.value, "value": "kitchen_gadgets", "confidence": 0.8, "source": "purchase"},
+        {"category": InterestCategory.BOOKS.value, "value": "self_improvement", "confidence": 0.9, "source": "purchase"},
+        {"category": InterestCategory.FOOD.value, "value": "healthy_cooking", "confidence": 0.7, "source": "behavior"},
         
         # David's interests (technology and music)
-        {"category": InterestCategory.TECHNOLOGY, "value": "gaming_equipment", "confidence": 0.95, "source": "purchase"},
-        {"category": InterestCategory.MUSIC, "value": "audio_equipment", "confidence": 0.8, "source": "purchase"},
-        {"category": InterestCategory.TECHNOLOGY, "value": "programming", "confidence": 0.7, "source": "survey"},
+        {"category": InterestCategory.TECHNOLOGY.value, "value": "gaming_equipment", "confidence": 0.95, "source": "purchase"},
+        {"category": InterestCategory.MUSIC.value, "value": "audio_equipment", "confidence": 0.8, "source": "purchase"},
+        {"category": InterestCategory.TECHNOLOGY.value, "value": "programming", "confidence": 0.7, "source": "survey"},
         
         # Emma's interests (beauty and fashion)
-        {"category": InterestCategory.BEAUTY, "value": "skincare_products", "confidence": 0.9, "source": "purchase"},
-        {"category": InterestCategory.FASHION, "value": "trendy_clothing", "confidence": 0.8, "source": "behavior"},
-        {"category": InterestCategory.FITNESS, "value": "pilates", "confidence": 0.6, "source": "survey"}
+        {"category": InterestCategory.BEAUTY.value, "value": "skincare_products", "confidence": 0.9, "source": "purchase"},
+        {"category": InterestCategory.FASHION.value, "value": "trendy_clothing", "confidence": 0.8, "source": "behavior"},
+        {"category": InterestCategory.FITNESS.value, "value": "pilates", "confidence": 0.6, "source": "survey"}
     ]
     return interests
 
@@ -310,7 +313,7 @@ def seed_database():
             interest = UserInterestModel(
                 id=str(uuid.uuid4()),
                 user_id=users[user_index].id,
-                interest_category=interest_info["category"].value,
+                interest_category=interest_info["category"],
                 interest_value=interest_info["value"],
                 confidence_score=interest_info["confidence"],
                 source=interest_info["source"]
@@ -356,20 +359,19 @@ def seed_database():
         # Add data to knowledge graph if available
         logger.info("Adding data to knowledge graph...")
         try:
-            for user in users:
-                from app.models.schemas import User
-                user_obj = User(
+            from app.models.schemas import User, Product, ProductCategory, Purchase, UserInterest
+            user_objs = [
+                User(
                     id=user.id,
                     email=user.email,
                     profile_data=user.profile_data,
                     created_at=user.created_at,
                     updated_at=user.updated_at
                 )
-                knowledge_graph_service.create_user_node(user_obj)
-            
-            for product in products:
-                from app.models.schemas import Product, ProductCategory
-                product_obj = Product(
+                for user in users
+            ]
+            product_objs = [
+                Product(
                     id=product.id,
                     name=product.name,
                     category=ProductCategory(product.category),
@@ -379,11 +381,10 @@ def seed_database():
                     metadata=product.extra_data,
                     created_at=product.created_at
                 )
-                knowledge_graph_service.create_product_node(product_obj)
-            
-            for purchase in purchases:
-                from app.models.schemas import Purchase
-                purchase_obj = Purchase(
+                for product in products
+            ]
+            purchase_objs = [
+                Purchase(
                     id=purchase.id,
                     user_id=purchase.user_id,
                     product_id=purchase.product_id,
@@ -392,20 +393,32 @@ def seed_database():
                     metadata=purchase.extra_data,
                     timestamp=purchase.timestamp
                 )
-                knowledge_graph_service.create_purchase_relationship(purchase_obj)
-            
-            for interest in interests:
-                from app.models.schemas import UserInterest, InterestCategory
-                interest_obj = UserInterest(
+                for purchase in purchases
+            ]
+            interest_objs = [
+                UserInterest(
                     id=interest.id,
                     user_id=interest.user_id,
-                    interest_category=InterestCategory(interest.interest_category),
+                    interest_category=INTEREST_CATEGORY_BY_VALUE[interest.interest_category],
                     interest_value=interest.interest_value,
                     confidence_score=interest.confidence_score,
                     source=interest.source,
                     created_at=interest.created_at
                 )
-                knowledge_graph_service.create_interest_relationship(interest_obj)
+                for interest in interests
+            ]
+            
+            # One pooled session and one transaction for all graph writes
+            with knowledge_graph_service.session() as kg:
+                tx = kg.begin_transaction()
+                try:
+                    knowledge_graph_service.create_user_nodes_bulk(tx, user_objs)
+                    knowledge_graph_service.create_product_nodes_bulk(tx, product_objs)
+                    knowledge_graph_service.create_purchase_relationships_bulk(tx, purchase_objs)
+                    knowledge_graph_service.create_interest_relationships_bulk(tx, interest_objs)
+                    tx.commit()
+                finally:
+                    tx.close()
             
             logger.info("Successfully added data to knowledge graph")
         except Exception as e:
@@ -4,10 +4,18 @@ Environment setup script to help configure environment variables
 """
 
 import os
+import re
 import secrets
 import string
 from pathlib import Path
 
+# Placeholder secret keys shipped in .env.example / the basic template
+SECRET_KEY_PLACEHOLDERS = (
+    "your-secret-key-change-in-production-please-use-a-strong-key",
+    "dev-secret-key-12345-change-in-production-67890-abcdef",
+)
+_SECRET_PLACEHOLDER_RE = re.compile("|".join(map(re.escape, SECRET_KEY_PLACEHOLDERS)))
+
 def generate_secret_key(length: int = 64) -> str:
     """Generate a secure secret key"""
     alphabet = string.ascii_letters + string.digits + "!@#$%^&*(-_=+)"
@@ -31,25 +39,17 @@ def setup_env_file():
     # Copy from example if it exists
     if env_example_file.exists():
         print("📋 Copying from .env.example...")
-        with open(env_example_file, 'r') as f:
-            content = f.read()
+        content = env_example_file.read_text()
     else:
         print("❌ .env.example not found. Creating basic template...")
         content = create_basic_env_template()
     
     # Generate secure secret key
     secret_key = generate_secret_key()
-    content = content.replace(
-        "your-secret-key-change-in-production-please-use-a-strong-key",
-        secret_key
-    ).replace(
-        "dev-secret-key-12345-change-in-production-67890-abcdef",
-        secret_key
-    )
+    content = _SECRET_PLACEHOLDER_RE.sub(lambda _: secret_key, content)
     
     # Write the file
-    with open(env_file, 'w') as f:
-        f.write(content)
+    env_file.write_text(content)
     
     print("✅ Environment file created successfully!")
     print(f"📍 Location: {env_file}")
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 """Test database connection and basic operations"""
 
+from sqlalchemy import func, select
+
+from app.core.auth import get_password_hash
 from app.core.database import check_db_connection, create_tables
-from app.repositories.user import user_repository
-from app.repositories.purchase import purchase_repository
-from app.models.schemas import UserCreate, PurchaseCreate
+from app.models.database import UserModel, PurchaseModel, generate_uuid
 from app.core.database import SessionLocal
 
 def test_connection():
@@ -17,34 +18,36 @@ def test_connection():
         print("❌ Database connection failed!")
         return
     
-    # Test basic operations
+    # Test basic operations in a single transaction; the repositories commit
+    # per call, so build the rows directly and let the block commit once
     db = SessionLocal()
     try:
-        # Create a test user
-        user_data = UserCreate(
-            email="test@hackathon.com",
-            profile_data={"age": 25, "interests": ["tech", "ai"]}
-        )
-        user = user_repository.create_user(db, user_data)
-        print(f"✅ Created user: {user.email} (ID: {user.id})")
-        
-        # Create a test purchase
-        purchase_data = PurchaseCreate(
-            user_id=user.id,
-            product_id="laptop-123",
-            amount=999.99,
-            quantity=1
-        )
-        purchase = purchase_repository.create_purchase(db, purchase_data)
-        print(f"✅ Created purchase: ${purchase.amount} for user {user.email}")
-        
-        # Get user purchases
-        purchases = purchase_repository.get_by_user_id(db, user.id)
-        print(f"✅ Found {len(purchases)} purchases for user")
-        
-        # Get total spent
-        total = purchase_repository.get_user_total_spent(db, user.id)
-        print(f"✅ Total spent by user: ${total}")
+        with db.begin():
+            # Create a test user and purchase
+            user = UserModel(
+                id=generate_uuid(),
+                email="test@hackathon.com",
+                hashed_password=get_password_hash("TestPassword123"),
+                profile_data={"age": 25, "interests": ["tech", "ai"]}
+            )
+            purchase = PurchaseModel(
+                user_id=user.id,
+                product_id="laptop-123",
+                amount=999.99,
+                quantity=1
+            )
+            db.add_all([user, purchase])
+            db.flush()
+            print(f"✅ Created user: {user.email} (ID: {user.id})")
+            print(f"✅ Created purchase: ${purchase.amount} for user {user.email}")
+            
+            # Get purchase count and total spent in one query
+            purchase_count, total = db.execute(
+                select(func.count(PurchaseModel.id), func.coalesce(func.sum(PurchaseModel.amount), 0.0))
+                .where(PurchaseModel.user_id == user.id)
+            ).one()
+            print(f"✅ Found {purchase_count} purchases for user")
+            print(f"✅ Total spent by user: ${float(total)}")
         
         print("\n🎉 All database operations working correctly!")
         
@@ -54,4 +57,4 @@ def test_connection():
         db.close()
 
 if __name__ == "__main__":
-    test_connection()
\ No newline at end of file
+    test_connection()
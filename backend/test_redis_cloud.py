@@ -16,39 +16,58 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import redis
-import json
+import orjson
+import socket
 from datetime import datetime
 
+# Redis configuration from environment
+REDIS_HOST = os.getenv('REDIS_HOST')
+REDIS_PORT = int(os.getenv('REDIS_PORT', 6379))
+REDIS_DB = int(os.getenv('REDIS_DB', 0))
+REDIS_PASSWORD = os.getenv('REDIS_PASSWORD')
+
+if REDIS_PASSWORD:
+    REDIS_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+else:
+    REDIS_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+
+# TCP keepalive tuning (option names are platform specific)
+KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
+
+# Shared pool so every check reuses already-authenticated connections.
+# redis-py enables TCP_NODELAY on every socket it opens, and socket_keepalive
+# turns on SO_KEEPALIVE, so no custom Connection class is needed.
+POOL = redis.ConnectionPool.from_url(
+    REDIS_URL,
+    max_connections=8,
+    socket_connect_timeout=10,
+    socket_timeout=10,
+    socket_keepalive=True,
+    socket_keepalive_options=KEEPALIVE_OPTIONS
+)
+
+# Set of every application key this script writes; cleanup reads it instead
+# of scanning the keyspace, and picks up keys left behind by aborted runs
+APP_KEY_INDEX = "marketing_app:_index"
+
 def test_redis_cloud_connection():
     """Test connection to Redis Cloud"""
     try:
-        # Get Redis configuration from environment
-        redis_host = os.getenv('REDIS_HOST')
-        redis_port = int(os.getenv('REDIS_PORT', 6379))
-        redis_db = int(os.getenv('REDIS_DB', 0))
-        redis_password = os.getenv('REDIS_PASSWORD')
+        now_iso = datetime.now().isoformat()
         
         print(f"🔴 Testing Redis Cloud Connection...")
-        print(f"   Host: {redis_host}")
-        print(f"   Port: {redis_port}")
-        print(f"   Database: {redis_db}")
-        print(f"   Password: {'*' * len(redis_password) if redis_password else 'None'}")
-        
-        # Create Redis connection
-        if redis_password:
-            redis_url = f"redis://:{redis_password}@{redis_host}:{redis_port}/{redis_db}"
-        else:
-            redis_url = f"redis://{redis_host}:{redis_port}/{redis_db}"
-        
-        print(f"   Connection URL: redis://:***@{redis_host}:{redis_port}/{redis_db}")
+        print(f"   Host: {REDIS_HOST}")
+        print(f"   Port: {REDIS_PORT}")
+        print(f"   Database: {REDIS_DB}")
+        print(f"   Password: {'*' * len(REDIS_PASSWORD) if REDIS_PASSWORD else 'None'}")
+        print(f"   Connection URL: redis://:***@{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}")
         
-        # Connect to Redis
-        r = redis.Redis.from_url(
-            redis_url,
-            decode_responses=False,
-            socket_connect_timeout=10,
-            socket_timeout=10
-        )
+        # Connect to Redis through the shared pool
+        r = redis.Redis(connection_pool=POOL)
         
         # Test basic operations
         print(f"\n🧪 Testing basic operations...")
@@ -61,29 +80,35 @@ def test_redis_cloud_connection():
         test_key = "test:vision2conversion:connection"
         test_value = {
             "message": "Redis Cloud connection successful!",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
             "app": "Vision2Conversion Backend"
         }
-        
-        # Set value
-        r.setex(test_key, 300, json.dumps(test_value))  # 5 minute expiry
+        test_payload = orjson.dumps(test_value)
+        
+        # Set, read back, clean up and fetch server info in one round trip
+        with r.pipeline(transaction=False) as pipe:
+            pipe.setex(test_key, 300, test_payload)  # 5 minute expiry
+            pipe.get(test_key)
+            pipe.delete(test_key)
+            # Only the INFO sections reported below
+            pipe.info("server")
+            pipe.info("memory")
+            pipe.info("clients")
+            _, retrieved, _, *info_sections = pipe.execute()
+        info = {key: value for section in info_sections for key, value in section.items()}
         print(f"   ✅ Set test data with key: {test_key}")
         
-        # Get value
-        retrieved = r.get(test_key)
         if retrieved:
-            retrieved_data = json.loads(retrieved)
+            retrieved_data = orjson.loads(retrieved)
             print(f"   ✅ Retrieved test data: {retrieved_data['message']}")
         else:
             print(f"   ❌ Failed to retrieve test data")
             return False
         
         # 3. Delete test
-        r.delete(test_key)
         print(f"   ✅ Cleaned up test data")
         
         # 4. Info test
-        info = r.info()
         print(f"   ✅ Redis version: {info.get('redis_version', 'Unknown')}")
         print(f"   ✅ Used memory: {info.get('used_memory_human', 'Unknown')}")
         print(f"   ✅ Connected clients: {info.get('connected_clients', 'Unknown')}")
@@ -98,28 +123,36 @@ def test_redis_cloud_connection():
             {"product_id": "prod_2", "score": 0.87, "reason": "Another test"}
         ]
         
-        r.setex(rec_key, 1800, json.dumps(rec_data))  # 30 minutes
-        print(f"   ✅ Set recommendation cache")
-        
         # Test analytics cache
         analytics_key = "marketing_app:analytics:overview"
         analytics_data = {
             "total_users": 100,
             "total_revenue": 50000.0,
-            "generated_at": datetime.now().isoformat()
+            "generated_at": now_iso
         }
         
-        r.setex(analytics_key, 600, json.dumps(analytics_data))  # 10 minutes
-        print(f"   ✅ Set analytics cache")
+        # Serialize before queueing so the pipelined block does no Python work
+        cache_payloads = {
+            rec_key: orjson.dumps(rec_data),
+            analytics_key: orjson.dumps(analytics_data)
+        }
         
-        # List all our app keys
-        app_keys = r.keys("marketing_app:*")
-        print(f"   ✅ Found {len(app_keys)} application cache keys")
+        keys_written = [rec_key, analytics_key]
+        with r.pipeline(transaction=False) as pipe:
+            pipe.mset(cache_payloads)
+            pipe.expire(rec_key, 1800)  # 30 minutes
+            pipe.expire(analytics_key, 600)  # 10 minutes
+            pipe.sadd(APP_KEY_INDEX, *keys_written)
+            pipe.exists(*keys_written)
+            found_keys = pipe.execute()[-1]
+        print(f"   ✅ Set recommendation cache")
+        print(f"   ✅ Set analytics cache")
+        print(f"   ✅ Found {found_keys} application cache keys")
         
-        # Clean up test keys
-        if app_keys:
-            r.delete(*app_keys)
-            print(f"   ✅ Cleaned up application test keys")
+        # Clean up test keys (plus anything an earlier run failed to remove)
+        indexed_keys = r.smembers(APP_KEY_INDEX)
+        r.delete(*indexed_keys, APP_KEY_INDEX)
+        print(f"   ✅ Cleaned up application test keys")
         
         print(f"\n🎉 Redis Cloud connection test SUCCESSFUL!")
         print(f"   Your application is ready to use Redis Cloud for caching.")
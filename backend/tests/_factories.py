@@ -0,0 +1,17 @@
+"""
+Schema builders for tests that need a trusted instance rather than a validation
+round-trip. model_construct skips validation entirely, so tests that exercise
+the validators must keep using the real constructors.
+"""
+from app.models.schemas import PurchaseCreate
+
+_PURCHASE_DEFAULTS = {
+    "product_id": "product123",
+    "amount": 99.99,
+    "quantity": 1
+}
+
+
+def build_purchase_create(**overrides) -> PurchaseCreate:
+    """Build a PurchaseCreate from the defaults without validating it"""
+    return PurchaseCreate.model_construct(**{**_PURCHASE_DEFAULTS, **overrides})
@@ -1,101 +1,182 @@
 import pytest
-from fastapi.testclient import TestClient
+from types import SimpleNamespace
 from app.main import app
+from app.core.database import get_db
+from app.models.database import UserModel, ProductModel, PurchaseModel
 from app.models.schemas import ProductCategory
+from tests.conftest import TestingSessionLocal, engine
 
-client = TestClient(app)
 
+# Expected fields per analytics endpoint; nested fields use dotted paths and
+# `object` only checks presence
+ANALYTICS_ENDPOINT_FIELDS = [
+    ("/api/v1/analytics/overview", {
+        "overview": dict,
+        "last_30_days": dict,
+        "generated_at": object,
+        "overview.total_users": int,
+        "overview.total_products": object,
+        "overview.total_purchases": object,
+        "overview.total_revenue": (int, float),
+        "overview.average_order_value": object,
+        "last_30_days.new_users": object,
+        "last_30_days.purchases": object,
+        "last_30_days.revenue": object
+    }),
+    ("/api/v1/analytics/products", {
+        "popular_products": list,
+        "category_performance": list,
+        "price_distribution": dict,
+        "total_products": int
+    }),
+    ("/api/v1/analytics/interests", {
+        "category_distribution": list,
+        "source_distribution": list,
+        "top_interests_by_category": dict
+    }),
+    ("/api/v1/analytics/revenue", {
+        "period_days": int,
+        "start_date": object,
+        "daily_revenue": list,
+        "category_revenue": list,
+        "top_customers": list
+    }),
+    ("/api/v1/analytics/dashboard", {
+        "overview": object,
+        "top_products": list,
+        "category_performance": list,
+        "interest_distribution": list,
+        "recent_revenue": list,
+        "revenue_by_category": object,
+        "generated_at": object
+    })
+]
 
+
+@pytest.fixture(scope="class")
+def analytics_connection():
+    """Hold an outer transaction for the analytics tests; everything they write is rolled back"""
+    connection = engine.connect()
+    transaction = connection.begin()
+    
+    yield connection
+    
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="class")
+def analytics_data(analytics_connection):
+    """Seed analytics baseline users, products and purchases once inside the outer transaction"""
+    # Setup rows go straight through the ORM; the HTTP layer isn't under test here
+    users = [
+        UserModel(
+            email="analytics_user1@example.com",
+            hashed_password="not-a-real-hash",
+            profile_data={"name": "Analytics User 1", "age": 25}
+        ),
+        UserModel(
+            email="analytics_user2@example.com",
+            hashed_password="not-a-real-hash",
+            profile_data={"name": "Analytics User 2", "age": 35}
+        )
+    ]
+    
+    products = [
+        ProductModel(
+            name="Analytics Test Laptop",
+            category=ProductCategory.ELECTRONICS.value,
+            price=999.99,
+            description="Test laptop for analytics"
+        ),
+        ProductModel(
+            name="Analytics Test Shirt",
+            category=ProductCategory.CLOTHING.value,
+            price=39.99,
+            description="Test shirt for analytics"
+        )
+    ]
+    
+    db = TestingSessionLocal(bind=analytics_connection, join_transaction_mode="create_savepoint")
+    try:
+        db.add_all(users + products)
+        db.flush()
+        
+        user_ids = [user.id for user in users]
+        product_ids = [product.id for product in products]
+        
+        db.add_all([
+            PurchaseModel(
+                user_id=user_id,
+                product_id=product_ids[i % len(product_ids)],
+                amount=199.99 + (i * 50),
+                quantity=1 + i
+            )
+            for i, user_id in enumerate(user_ids)
+        ])
+        db.commit()
+    finally:
+        db.close()
+    
+    return SimpleNamespace(user_ids=user_ids, product_ids=product_ids)
+
+
+@pytest.fixture
+def analytics_session(analytics_connection, analytics_data):
+    """Serve requests from a session whose writes roll back to the baseline after each test"""
+    savepoint = analytics_connection.begin_nested()
+    session = TestingSessionLocal(bind=analytics_connection, join_transaction_mode="create_savepoint")
+    
+    def override_get_analytics_session():
+        yield session
+    
+    previous_override = app.dependency_overrides[get_db]
+    app.dependency_overrides[get_db] = override_get_analytics_session
+    
+    yield session
+    
+    app.dependency_overrides[get_db] = previous_override
+    session.close()
+    savepoint.rollback()
+
+
+@pytest.mark.xdist_group("analytics")
 class TestAnalyticsAPI:
     
     @pytest.fixture(autouse=True)
-    def setup_test_data(self):
-        """Setup test data for analytics tests"""
-        # Create test users
-        users_data = [
-            {
-                "email": "analytics_user1@example.com",
-                "profile_data": {"name": "Analytics User 1", "age": 25}
-            },
-            {
-                "email": "analytics_user2@example.com", 
-                "profile_data": {"name": "Analytics User 2", "age": 35}
-            }
-        ]
-        
-        self.user_ids = []
-        for user_data in users_data:
-            response = client.post("/api/v1/users/", json=user_data)
-            assert response.status_code == 201
-            self.user_ids.append(response.json()["id"])
-        
-        # Create test products
-        products_data = [
-            {
-                "name": "Analytics Test Laptop",
-                "category": ProductCategory.ELECTRONICS.value,
-                "price": 999.99,
-                "description": "Test laptop for analytics"
-            },
-            {
-                "name": "Analytics Test Shirt",
-                "category": ProductCategory.CLOTHING.value,
-                "price": 39.99,
-                "description": "Test shirt for analytics"
-            }
-        ]
-        
-        self.product_ids = []
-        for product_data in products_data:
-            response = client.post("/api/v1/products/", json=product_data)
-            assert response.status_code == 201
-            self.product_ids.append(response.json()["id"])
-        
-        # Create test purchases
-        for i, user_id in enumerate(self.user_ids):
-            purchase_data = {
-                "purchases": [
-                    {
-                        "product_id": self.product_ids[i % len(self.product_ids)],
-                        "amount": 199.99 + (i * 50),
-                        "quantity": 1 + i
-                    }
-                ]
-            }
-            
-            response = client.post(f"/api/v1/users/{user_id}/data", json=purchase_data)
-            assert response.status_code == 201
+    def setup_test_data(self, analytics_data, analytics_session):
+        """Expose the analytics baseline shared by the class"""
+        self.user_ids = analytics_data.user_ids
+        self.product_ids = analytics_data.product_ids
     
-    def test_get_platform_overview(self):
-        """Test getting platform overview analytics"""
-        response = client.get("/api/v1/analytics/overview")
+    @pytest.mark.parametrize("path,expected_fields", ANALYTICS_ENDPOINT_FIELDS)
+    def test_analytics_endpoint_structure(self, client, path, expected_fields):
+        """Test analytics endpoints return the expected fields and types"""
+        response = client.get(path)
         
         assert response.status_code == 200
         data = response.json()
         
-        # Check overview structure
-        assert "overview" in data
-        assert "last_30_days" in data
-        assert "generated_at" in data
-        
-        overview = data["overview"]
-        assert "total_users" in overview
-        assert "total_products" in overview
-        assert "total_purchases" in overview
-        assert "total_revenue" in overview
-        assert "average_order_value" in overview
-        
-        last_30_days = data["last_30_days"]
-        assert "new_users" in last_30_days
-        assert "purchases" in last_30_days
-        assert "revenue" in last_30_days
-        
-        # Verify data types
-        assert isinstance(overview["total_users"], int)
-        assert isinstance(overview["total_revenue"], (int, float))
-        assert overview["total_users"] >= 2  # We created 2 users
+        for field, expected_type in expected_fields.items():
+            value = data
+            for key in field.split("."):
+                assert key in value, f"{field} missing from {path}"
+                value = value[key]
+            assert isinstance(value, expected_type), f"{field} has unexpected type in {path}"
     
-    def test_get_user_analytics(self):
+    def test_analytics_reflect_baseline_data(self, client):
+        """Test aggregate analytics include the baseline data and default limits"""
+        overview = client.get("/api/v1/analytics/overview")
+        products = client.get("/api/v1/analytics/products")
+        revenue = client.get("/api/v1/analytics/revenue")
+        dashboard = client.get("/api/v1/analytics/dashboard")
+        
+        assert overview.json()["overview"]["total_users"] >= 2  # We created 2 users
+        assert products.json()["total_products"] >= 2  # We created 2 products
+        assert revenue.json()["period_days"] == 30  # Default period
+        assert len(dashboard.json()["top_products"]) <= 10  # Should be limited to top 10
+    
+    def test_get_user_analytics(self, client):
         """Test getting analytics for a specific user"""
         user_id = self.user_ids[0]
         response = client.get(f"/api/v1/analytics/users/{user_id}")
@@ -121,27 +202,7 @@ class TestAnalyticsAPI:
         assert isinstance(purchase_analytics["total_purchases"], int)
         assert purchase_analytics["total_purchases"] >= 1  # We created at least 1 purchase
     
-    def test_get_product_analytics(self):
-        """Test getting product analytics"""
-        response = client.get("/api/v1/analytics/products")
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        # Check product analytics structure
-        assert "popular_products" in data
-        assert "category_performance" in data
-        assert "price_distribution" in data
-        assert "total_products" in data
-        
-        # Verify data types
-        assert isinstance(data["popular_products"], list)
-        assert isinstance(data["category_performance"], list)
-        assert isinstance(data["price_distribution"], dict)
-        assert isinstance(data["total_products"], int)
-        assert data["total_products"] >= 2  # We created 2 products
-    
-    def test_get_product_analytics_with_limit(self):
+    def test_get_product_analytics_with_limit(self, client):
         """Test getting product analytics with custom limit"""
         response = client.get("/api/v1/analytics/products?limit=5")
         
@@ -149,45 +210,7 @@ class TestAnalyticsAPI:
         data = response.json()
         assert len(data["popular_products"]) <= 5
     
-    def test_get_interest_analytics(self):
-        """Test getting interest analytics"""
-        response = client.get("/api/v1/analytics/interests")
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        # Check interest analytics structure
-        assert "category_distribution" in data
-        assert "source_distribution" in data
-        assert "top_interests_by_category" in data
-        
-        # Verify data types
-        assert isinstance(data["category_distribution"], list)
-        assert isinstance(data["source_distribution"], list)
-        assert isinstance(data["top_interests_by_category"], dict)
-    
-    def test_get_revenue_analytics(self):
-        """Test getting revenue analytics"""
-        response = client.get("/api/v1/analytics/revenue")
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        # Check revenue analytics structure
-        assert "period_days" in data
-        assert "start_date" in data
-        assert "daily_revenue" in data
-        assert "category_revenue" in data
-        assert "top_customers" in data
-        
-        # Verify data types
-        assert isinstance(data["period_days"], int)
-        assert isinstance(data["daily_revenue"], list)
-        assert isinstance(data["category_revenue"], list)
-        assert isinstance(data["top_customers"], list)
-        assert data["period_days"] == 30  # Default period
-    
-    def test_get_revenue_analytics_custom_period(self):
+    def test_get_revenue_analytics_custom_period(self, client):
         """Test getting revenue analytics with custom period"""
         response = client.get("/api/v1/analytics/revenue?days=7")
         
@@ -195,30 +218,7 @@ class TestAnalyticsAPI:
         data = response.json()
         assert data["period_days"] == 7
     
-    def test_get_analytics_dashboard(self):
-        """Test getting comprehensive analytics dashboard"""
-        response = client.get("/api/v1/analytics/dashboard")
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        # Check dashboard structure
-        assert "overview" in data
-        assert "top_products" in data
-        assert "category_performance" in data
-        assert "interest_distribution" in data
-        assert "recent_revenue" in data
-        assert "revenue_by_category" in data
-        assert "generated_at" in data
-        
-        # Verify data types
-        assert isinstance(data["top_products"], list)
-        assert isinstance(data["category_performance"], list)
-        assert isinstance(data["interest_distribution"], list)
-        assert isinstance(data["recent_revenue"], list)
-        assert len(data["top_products"]) <= 10  # Should be limited to top 10
-    
-    def test_refresh_analytics_cache(self):
+    def test_refresh_analytics_cache(self, client):
         """Test refreshing analytics cache"""
         response = client.post("/api/v1/analytics/refresh")
         
@@ -228,12 +228,12 @@ class TestAnalyticsAPI:
         assert "cleared_entries" in data
         assert "cache refreshed" in data["message"]
     
-    def test_user_analytics_not_found(self):
+    def test_user_analytics_not_found(self, client):
         """Test getting analytics for non-existent user"""
         response = client.get("/api/v1/analytics/users/nonexistent-user-id")
         assert response.status_code == 404
     
-    def test_revenue_analytics_invalid_period(self):
+    def test_revenue_analytics_invalid_period(self, client):
         """Test revenue analytics with invalid period"""
         # Test with period exceeding maximum
         response = client.get("/api/v1/analytics/revenue?days=400")
@@ -243,7 +243,7 @@ class TestAnalyticsAPI:
         response = client.get("/api/v1/analytics/revenue?days=-5")
         assert response.status_code == 422  # Validation error
     
-    def test_product_analytics_invalid_limit(self):
+    def test_product_analytics_invalid_limit(self, client):
         """Test product analytics with invalid limit"""
         # Test with limit exceeding maximum
         response = client.get("/api/v1/analytics/products?limit=1000")
@@ -253,7 +253,7 @@ class TestAnalyticsAPI:
         response = client.get("/api/v1/analytics/products?limit=0")
         assert response.status_code == 422  # Validation error
     
-    def test_analytics_caching_behavior(self):
+    def test_analytics_caching_behavior(self, client):
         """Test that analytics endpoints respect caching"""
         # First request should generate fresh data
         response1 = client.get("/api/v1/analytics/overview")
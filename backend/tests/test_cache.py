@@ -1,26 +1,27 @@
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
+from tests.conftest import JSON_HEADERS
 
-client = TestClient(app)
+CACHE_WARM_URL = "/api/v1/cache/_test/warm"
 
+CACHE_USER_BODY = orjson.dumps({
+    "email": "cache_test@example.com",
+    "profile_data": {"name": "Cache Test User"}
+})
 
+
+@pytest.mark.xdist_group("cache")
 class TestCacheAPI:
     
-    @pytest.fixture(autouse=True)
-    def setup_test_data(self):
-        """Setup test user for cache tests"""
-        # Create test user
-        user_data = {
-            "email": "cache_test@example.com",
-            "profile_data": {"name": "Cache Test User"}
-        }
-        
-        user_response = client.post("/api/v1/users/", json=user_data)
+    @pytest.fixture(scope="class", autouse=True)
+    def setup_test_data(self, request, client):
+        """Setup test user shared by all cache tests"""
+        # Create test user once per class; tests read it back as self.user_id
+        user_response = client.post("/api/v1/users/", content=CACHE_USER_BODY, headers=JSON_HEADERS)
         assert user_response.status_code == 201
-        self.user_id = user_response.json()["id"]
+        request.cls.user_id = user_response.json()["id"]
     
-    def test_get_cache_stats(self):
+    def test_get_cache_stats(self, client):
         """Test getting cache statistics"""
         response = client.get("/api/v1/cache/stats")
         
@@ -45,7 +46,7 @@ class TestCacheAPI:
             # Error status
             assert "error" in data
     
-    def test_cache_health_check(self):
+    def test_cache_health_check(self, client):
         """Test cache health check endpoint"""
         response = client.get("/api/v1/cache/health")
         
@@ -61,11 +62,18 @@ class TestCacheAPI:
         assert data["status"] in ["healthy", "degraded", "unhealthy"]
         assert isinstance(data["cache_connected"], bool)
     
-    def test_invalidate_user_cache(self):
+    @pytest.mark.usefixtures("test_endpoints_enabled")
+    def test_invalidate_user_cache(self, client):
         """Test invalidating cache for a specific user"""
-        # First, generate some cached data by making requests
-        client.get(f"/api/v1/recommendations/users/{self.user_id}")
-        client.get(f"/api/v1/analytics/users/{self.user_id}")
+        # First, seed some cached data for the user
+        client.post(
+            CACHE_WARM_URL,
+            content=orjson.dumps({"keys": [
+                f"marketing_app:recommendations:{self.user_id}",
+                f"marketing_app:analytics:user:{self.user_id}"
+            ]}),
+            headers=JSON_HEADERS
+        )
         
         # Now invalidate user cache
         response = client.delete(f"/api/v1/cache/users/{self.user_id}")
@@ -77,10 +85,15 @@ class TestCacheAPI:
         assert self.user_id in data["message"]
         assert isinstance(data["deleted_entries"], int)
     
-    def test_invalidate_trending_cache(self):
+    @pytest.mark.usefixtures("test_endpoints_enabled")
+    def test_invalidate_trending_cache(self, client):
         """Test invalidating trending products cache"""
-        # First, generate trending cache by making request
-        client.get("/api/v1/recommendations/trending")
+        # First, seed the trending cache
+        client.post(
+            CACHE_WARM_URL,
+            content=orjson.dumps({"keys": ["marketing_app:trending:products"]}),
+            headers=JSON_HEADERS
+        )
         
         # Now invalidate trending cache
         response = client.delete("/api/v1/cache/trending")
@@ -92,12 +105,19 @@ class TestCacheAPI:
         assert "trending products cache invalidated" in data["message"]
         assert isinstance(data["success"], bool)
     
-    def test_flush_all_cache(self):
+    @pytest.mark.usefixtures("test_endpoints_enabled")
+    def test_flush_all_cache(self, client):
         """Test flushing all cache entries"""
-        # First, generate some cached data
-        client.get("/api/v1/analytics/overview")
-        client.get(f"/api/v1/recommendations/users/{self.user_id}")
-        client.get("/api/v1/recommendations/trending")
+        # First, seed some cached data
+        client.post(
+            CACHE_WARM_URL,
+            content=orjson.dumps({"keys": [
+                "marketing_app:analytics:overview",
+                f"marketing_app:recommendations:{self.user_id}",
+                "marketing_app:trending:products"
+            ]}),
+            headers=JSON_HEADERS
+        )
         
         # Now flush all cache
         response = client.delete("/api/v1/cache/all")
@@ -109,7 +129,7 @@ class TestCacheAPI:
         assert "All cache entries flushed" in data["message"]
         assert isinstance(data["deleted_entries"], int)
     
-    def test_cache_invalidation_for_nonexistent_user(self):
+    def test_cache_invalidation_for_nonexistent_user(self, client):
         """Test cache invalidation for non-existent user"""
         response = client.delete("/api/v1/cache/users/nonexistent-user-id")
         
@@ -118,7 +138,7 @@ class TestCacheAPI:
         data = response.json()
         assert data["deleted_entries"] == 0
     
-    def test_cache_behavior_with_recommendations(self):
+    def test_cache_behavior_with_recommendations(self, client):
         """Test that cache works properly with recommendations endpoint"""
         # First request should populate cache
         response1 = client.get(f"/api/v1/recommendations/users/{self.user_id}")
@@ -139,7 +159,7 @@ class TestCacheAPI:
         response3 = client.get(f"/api/v1/recommendations/users/{self.user_id}")
         assert response3.status_code == 200
     
-    def test_cache_behavior_with_analytics(self):
+    def test_cache_behavior_with_analytics(self, client):
         """Test that cache works properly with analytics endpoint"""
         # First request should populate cache
         response1 = client.get("/api/v1/analytics/overview")
@@ -160,17 +180,30 @@ class TestCacheAPI:
         response3 = client.get("/api/v1/analytics/overview")
         assert response3.status_code == 200
     
-    def test_multiple_cache_operations(self):
+    @pytest.mark.usefixtures("test_endpoints_enabled")
+    def test_multiple_cache_operations(self, client):
         """Test multiple cache operations in sequence"""
-        # Generate various cached data
-        client.get("/api/v1/analytics/overview")
-        client.get(f"/api/v1/recommendations/users/{self.user_id}")
-        client.get("/api/v1/recommendations/trending")
-        client.get(f"/api/v1/analytics/users/{self.user_id}")
-        
-        # Check cache stats
+        # Seed various cached data; the response carries the cache stats too
+        warmed_keys = [
+            "marketing_app:analytics:overview",
+            f"marketing_app:recommendations:{self.user_id}",
+            "marketing_app:trending:products",
+            f"marketing_app:analytics:user:{self.user_id}"
+        ]
+        warm_response = client.post(
+            CACHE_WARM_URL,
+            content=orjson.dumps({"keys": warmed_keys}),
+            headers=JSON_HEADERS
+        )
+        assert warm_response.status_code == 200
+        assert "status" in warm_response.json()["stats"]
+        
+        # Stats probed between the writes must already count the warmed keys
         stats_response = client.get("/api/v1/cache/stats")
         assert stats_response.status_code == 200
+        warmed_stats = stats_response.json()
+        if warmed_stats["status"] == "connected":
+            assert warmed_stats["total_keys"] >= len(warmed_keys)
         
         # Invalidate user-specific cache
         user_cache_response = client.delete(f"/api/v1/cache/users/{self.user_id}")
@@ -180,14 +213,33 @@ class TestCacheAPI:
         trending_cache_response = client.delete("/api/v1/cache/trending")
         assert trending_cache_response.status_code == 200
         
-        # Check cache stats again
-        stats_response2 = client.get("/api/v1/cache/stats")
-        assert stats_response2.status_code == 200
-        
         # Finally flush all cache
         flush_response = client.delete("/api/v1/cache/all")
         assert flush_response.status_code == 200
         
-        # Final stats check
-        stats_response3 = client.get("/api/v1/cache/stats")
-        assert stats_response3.status_code == 200
\ No newline at end of file
+        # Final check in one pipelined snapshot
+        snapshot_response = client.get(
+            "/api/v1/cache/snapshot", params={"sections": ["memory", "stats"]}
+        )
+        assert snapshot_response.status_code == 200
+        snapshot = snapshot_response.json()
+        if snapshot["status"] == "connected":
+            assert set(snapshot["sections"]) == {"memory", "stats"}
+            # The two analytics keys survived the user and trending invalidations
+            # and are only removed by the flush
+            if warmed_stats["status"] == "connected":
+                assert snapshot["key_count"] <= warmed_stats["total_keys"] - 2
+    
+    def test_cache_snapshot_rejects_unknown_section(self, client):
+        """Test the snapshot endpoint only accepts known INFO sections"""
+        response = client.get("/api/v1/cache/snapshot", params={"sections": "commandstats"})
+        assert response.status_code == 400
+    
+    def test_warm_cache_disabled_outside_tests(self, client):
+        """Test the cache warm endpoint is hidden unless test endpoints are enabled"""
+        response = client.post(
+            CACHE_WARM_URL,
+            content=orjson.dumps({"keys": ["marketing_app:trending:products"]}),
+            headers=JSON_HEADERS
+        )
+        assert response.status_code == 404
@@ -1,89 +1,100 @@
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
+from types import MappingProxyType
 from app.models.schemas import EmailTemplateType, ProductCategory
+from tests.conftest import JSON_HEADERS
 
-client = TestClient(app)
+MARKETING_USER_BODY = orjson.dumps({
+    "email": "marketing_test@example.com",
+    "profile_data": {"name": "Marketing Test User", "age": 28}
+})
+
+MARKETING_PRODUCT_BODY = orjson.dumps({
+    "name": "Marketing Test Product",
+    "category": ProductCategory.ELECTRONICS.value,
+    "price": 199.99,
+    "description": "A great product for testing marketing features"
+})
+
+MARKETING_INTEREST_BODY = orjson.dumps({
+    "interest_category": "technology",
+    "interest_value": "smartphones",
+    "confidence_score": 0.8,
+    "source": "test"
+})
+
+# Read-only prototype for vision board requests; tests spread it into a new dict
+VISION_BOARD_REQUEST = MappingProxyType({"product_limit": 4, "style": "modern"})
+
+# 101 user IDs exceeds the per-campaign limit
+OVERSIZED_CAMPAIGN_BODY = orjson.dumps({
+    "user_ids": list(map("user-{}".format, range(101))),
+    "template_type": EmailTemplateType.WELCOME.value
+})
 
 
 class TestMarketingAPI:
     
     @pytest.fixture(autouse=True)
-    def setup_test_data(self):
+    def setup_test_data(self, client):
         """Setup test user for marketing tests"""
         # Create test user
-        user_data = {
-            "email": "marketing_test@example.com",
-            "profile_data": {"name": "Marketing Test User", "age": 28}
-        }
-        
-        user_response = client.post("/api/v1/users/", json=user_data)
+        user_response = client.post("/api/v1/users/", content=MARKETING_USER_BODY, headers=JSON_HEADERS)
         assert user_response.status_code == 201
         self.user_id = user_response.json()["id"]
         
         # Create test products
-        product_data = {
-            "name": "Marketing Test Product",
-            "category": ProductCategory.ELECTRONICS.value,
-            "price": 199.99,
-            "description": "A great product for testing marketing features"
-        }
-        
-        product_response = client.post("/api/v1/products/", json=product_data)
+        product_response = client.post(
+            "/api/v1/products/",
+            content=MARKETING_PRODUCT_BODY,
+            headers=JSON_HEADERS
+        )
         assert product_response.status_code == 201
         self.product_id = product_response.json()["id"]
         
         # Add some interests
-        interest_data = {
-            "interest_category": "technology",
-            "interest_value": "smartphones",
-            "confidence_score": 0.8,
-            "source": "test"
-        }
-        
         interest_response = client.post(
             f"/api/v1/interests/users/{self.user_id}/interests", 
-            json=interest_data
+            content=MARKETING_INTEREST_BODY,
+            headers=JSON_HEADERS
         )
         # Note: This might fail if the interests endpoint is not properly set up
         # but we continue with the marketing tests
     
-    def test_generate_personalized_email(self):
-        """Test generating personalized email content"""
+    @pytest.mark.parametrize("template_type,extra_fields,subject_keyword", [
+        (
+            EmailTemplateType.PERSONALIZED_RECOMMENDATIONS,
+            {"additional_data": {"campaign_name": "test_campaign"}, "recommendations_limit": 3},
+            None
+        ),
+        (EmailTemplateType.WELCOME, {"recommendations_limit": 5}, "welcome")
+    ])
+    def test_generate_email(self, client, template_type, extra_fields, subject_keyword):
+        """Test generating email content for each template type"""
         email_request = {
             "user_id": self.user_id,
-            "template_type": EmailTemplateType.PERSONALIZED_RECOMMENDATIONS.value,
-            "additional_data": {"campaign_name": "test_campaign"},
-            "recommendations_limit": 3
+            "template_type": template_type.value,
+            **extra_fields
         }
         
-        response = client.post("/api/v1/marketing/emails/generate", json=email_request)
+        response = client.post(
+            "/api/v1/marketing/emails/generate",
+            content=orjson.dumps(email_request),
+            headers=JSON_HEADERS
+        )
         
         assert response.status_code == 200
         data = response.json()
         assert data["user_id"] == self.user_id
-        assert data["template_type"] == EmailTemplateType.PERSONALIZED_RECOMMENDATIONS.value
+        assert data["template_type"] == template_type.value
         assert "subject" in data
         assert "html_content" in data
         assert "text_content" in data
         assert isinstance(data["recommendations"], list)
+        if subject_keyword:
+            assert subject_keyword in data["subject"].lower()
     
-    def test_generate_welcome_email(self):
-        """Test generating welcome email"""
-        email_request = {
-            "user_id": self.user_id,
-            "template_type": EmailTemplateType.WELCOME.value,
-            "recommendations_limit": 5
-        }
-        
-        response = client.post("/api/v1/marketing/emails/generate", json=email_request)
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["template_type"] == EmailTemplateType.WELCOME.value
-        assert "Welcome" in data["subject"] or "welcome" in data["subject"]
-    
-    def test_get_email_templates(self):
+    def test_get_email_templates(self, client):
         """Test getting available email templates"""
         response = client.get("/api/v1/marketing/emails/templates")
         
@@ -101,7 +112,7 @@ class TestMarketingAPI:
         assert "html_template" in template
         assert "text_template" in template
     
-    def test_preview_email_template(self):
+    def test_preview_email_template(self, client):
         """Test previewing email template"""
         template_type = EmailTemplateType.PERSONALIZED_RECOMMENDATIONS.value
         response = client.get(f"/api/v1/marketing/emails/templates/{template_type}/preview")
@@ -112,7 +123,7 @@ class TestMarketingAPI:
         assert "html_content" in data
         assert "text_content" in data
     
-    def test_get_email_template_types(self):
+    def test_get_email_template_types(self, client):
         """Test getting available email template types"""
         response = client.get("/api/v1/marketing/emails/template-types")
         
@@ -123,17 +134,21 @@ class TestMarketingAPI:
         assert EmailTemplateType.PERSONALIZED_RECOMMENDATIONS.value in data["template_types"]
         assert EmailTemplateType.WELCOME.value in data["template_types"]
     
-    def test_generate_vision_board(self):
+    def test_generate_vision_board(self, client):
         """Test generating vision board"""
         vision_board_request = {
+            **VISION_BOARD_REQUEST,
             "user_id": self.user_id,
             "theme": "Tech Enthusiast",
             "categories": [ProductCategory.ELECTRONICS.value],
-            "product_limit": 6,
-            "style": "modern"
+            "product_limit": 6
         }
         
-        response = client.post("/api/v1/marketing/vision-boards/generate", json=vision_board_request)
+        response = client.post(
+            "/api/v1/marketing/vision-boards/generate",
+            content=orjson.dumps(vision_board_request),
+            headers=JSON_HEADERS
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -145,15 +160,15 @@ class TestMarketingAPI:
         assert "style_config" in data
         assert len(data["products"]) <= 6
     
-    def test_generate_vision_board_without_theme(self):
+    def test_generate_vision_board_without_theme(self, client):
         """Test generating vision board without specified theme"""
-        vision_board_request = {
-            "user_id": self.user_id,
-            "product_limit": 4,
-            "style": "minimal"
-        }
+        vision_board_request = {**VISION_BOARD_REQUEST, "user_id": self.user_id, "style": "minimal"}
         
-        response = client.post("/api/v1/marketing/vision-boards/generate", json=vision_board_request)
+        response = client.post(
+            "/api/v1/marketing/vision-boards/generate",
+            content=orjson.dumps(vision_board_request),
+            headers=JSON_HEADERS
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -161,7 +176,7 @@ class TestMarketingAPI:
         assert len(data["products"]) <= 4
         assert data["style_config"]["style_name"] == "minimal"
     
-    def test_get_vision_board_themes(self):
+    def test_get_vision_board_themes(self, client):
         """Test getting available vision board themes"""
         response = client.get("/api/v1/marketing/vision-boards/themes")
         
@@ -171,7 +186,7 @@ class TestMarketingAPI:
         assert isinstance(data["themes"], list)
         assert len(data["themes"]) > 0
     
-    def test_get_vision_board_styles(self):
+    def test_get_vision_board_styles(self, client):
         """Test getting available vision board styles"""
         response = client.get("/api/v1/marketing/vision-boards/styles")
         
@@ -185,24 +200,40 @@ class TestMarketingAPI:
         assert "name" in style
         assert "description" in style
     
-    def test_create_email_campaign(self):
+    def test_create_email_campaign(self, client):
         """Test creating email campaign for multiple users"""
-        # Create another test user
-        user_data2 = {
-            "email": "campaign_test2@example.com",
-            "profile_data": {"name": "Campaign User 2"}
-        }
-        user_response2 = client.post("/api/v1/users/", json=user_data2)
+        # Create the campaign users
+        user_response1 = client.post(
+            "/api/v1/users/",
+            content=orjson.dumps({
+                "email": "campaign_test1@example.com",
+                "profile_data": {"name": "Campaign User 1"}
+            }),
+            headers=JSON_HEADERS
+        )
+        assert user_response1.status_code == 201
+        
+        user_response2 = client.post(
+            "/api/v1/users/",
+            content=orjson.dumps({
+                "email": "campaign_test2@example.com",
+                "profile_data": {"name": "Campaign User 2"}
+            }),
+            headers=JSON_HEADERS
+        )
         assert user_response2.status_code == 201
-        user_id2 = user_response2.json()["id"]
         
         campaign_data = {
-            "user_ids": [self.user_id, user_id2],
+            "user_ids": [user_response1.json()["id"], user_response2.json()["id"]],
             "template_type": EmailTemplateType.WELCOME.value,
             "additional_data": {"campaign_id": "test_campaign_123"}
         }
         
-        response = client.post("/api/v1/marketing/campaigns/email", json=campaign_data)
+        response = client.post(
+            "/api/v1/marketing/campaigns/email",
+            content=orjson.dumps(campaign_data),
+            headers=JSON_HEADERS
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -212,60 +243,56 @@ class TestMarketingAPI:
         assert "failed" in data
         assert "results" in data
     
-    def test_email_generation_user_not_found(self):
+    def test_email_generation_user_not_found(self, client):
         """Test email generation for non-existent user"""
         email_request = {
             "user_id": "nonexistent-user-id",
             "template_type": EmailTemplateType.WELCOME.value
         }
         
-        response = client.post("/api/v1/marketing/emails/generate", json=email_request)
+        response = client.post(
+            "/api/v1/marketing/emails/generate",
+            content=orjson.dumps(email_request),
+            headers=JSON_HEADERS
+        )
         assert response.status_code == 404
     
-    def test_vision_board_user_not_found(self):
+    def test_vision_board_user_not_found(self, client):
         """Test vision board generation for non-existent user"""
-        vision_board_request = {
-            "user_id": "nonexistent-user-id",
-            "product_limit": 4
-        }
+        vision_board_request = {**VISION_BOARD_REQUEST, "user_id": "nonexistent-user-id"}
         
-        response = client.post("/api/v1/marketing/vision-boards/generate", json=vision_board_request)
+        response = client.post(
+            "/api/v1/marketing/vision-boards/generate",
+            content=orjson.dumps(vision_board_request),
+            headers=JSON_HEADERS
+        )
         assert response.status_code == 404
     
-    def test_invalid_email_template_type(self):
+    def test_invalid_email_template_type(self, client):
         """Test preview with invalid template type"""
         response = client.get("/api/v1/marketing/emails/templates/invalid_template/preview")
         assert response.status_code == 422  # Validation error
     
-    def test_campaign_with_too_many_users(self):
+    def test_campaign_with_too_many_users(self, client):
         """Test email campaign with too many users (should be limited)"""
-        # Create list of 101 user IDs (exceeds limit)
-        user_ids = [f"user-{i}" for i in range(101)]
-        
-        campaign_data = {
-            "user_ids": user_ids,
-            "template_type": EmailTemplateType.WELCOME.value
-        }
-        
-        response = client.post("/api/v1/marketing/campaigns/email", json=campaign_data)
+        response = client.post(
+            "/api/v1/marketing/campaigns/email",
+            content=OVERSIZED_CAMPAIGN_BODY,
+            headers=JSON_HEADERS
+        )
         assert response.status_code == 400  # Should reject too many users
+        # Rejected by the batch size check, before any user lookup
+        assert response.json()["detail"] == "Maximum 100 users per campaign"
     
-    def test_vision_board_with_different_limits(self):
+    @pytest.mark.parametrize("product_limit", [4, 16])  # Minimum and maximum limits
+    def test_vision_board_with_different_limits(self, client, product_limit):
         """Test vision board generation with different product limits"""
-        # Test minimum limit
-        vision_board_request = {
-            "user_id": self.user_id,
-            "product_limit": 4
-        }
-        
-        response = client.post("/api/v1/marketing/vision-boards/generate", json=vision_board_request)
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["products"]) <= 4
-        
-        # Test maximum limit
-        vision_board_request["product_limit"] = 16
-        response = client.post("/api/v1/marketing/vision-boards/generate", json=vision_board_request)
+        payload = orjson.dumps({**VISION_BOARD_REQUEST, "user_id": self.user_id, "product_limit": product_limit})
+        response = client.post(
+            "/api/v1/marketing/vision-boards/generate",
+            content=payload,
+            headers=JSON_HEADERS
+        )
         assert response.status_code == 200
         data = response.json()
-        assert len(data["products"]) <= 16
\ No newline at end of file
+        assert len(data["products"]) <= product_limit
\ No newline at end of file
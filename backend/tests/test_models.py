@@ -1,15 +1,39 @@
 import pytest
 from datetime import datetime
-from pydantic import ValidationError
+from functools import lru_cache
+from typing import get_args
+from pydantic import TypeAdapter, ValidationError
 from app.models.schemas import (
     User, UserCreate, Product, ProductCreate, 
     Purchase, PurchaseCreate, UserInterest, UserInterestCreate,
-    Recommendation, UserDataIngestion, InterestCategory, ProductCategory
+    Recommendation, UserDataIngestion, InterestCategory, ProductCategory,
+    InterestCategoryLiteral, ProductCategoryLiteral
 )
 from app.core.validation import (
     validate_user_data, validate_product_data, validate_purchase_data,
     validate_interest_data, validate_confidence_score, validate_price
 )
+from app.core.validation import ValidationError as CoreValidationError
+
+# Built once so the ingestion tests reuse the same core validator
+_INGESTION_ADAPTER = TypeAdapter(UserDataIngestion)
+
+
+@lru_cache(maxsize=1)
+def _oversized_purchases():
+    """101 purchases, one over the batch limit; built once and shared read-only"""
+    base = {"user_id": "user123", "amount": 10.0}
+    return tuple({**base, "product_id": f"product{i}"} for i in range(101))
+
+
+class TestCategoryLiterals:
+    @pytest.mark.parametrize("literal_type,enum_type", [
+        (InterestCategoryLiteral, InterestCategory),
+        (ProductCategoryLiteral, ProductCategory)
+    ])
+    def test_literal_matches_enum(self, literal_type, enum_type):
+        literal = get_args(literal_type)[0]
+        assert get_args(literal) == tuple(member.value for member in enum_type)
 
 
 class TestUserModels:
@@ -143,24 +167,16 @@ class TestUserDataIngestion:
                 }
             ]
         }
-        ingestion = UserDataIngestion(**data)
+        ingestion = _INGESTION_ADAPTER.validate_python(data)
         assert len(ingestion.purchases) == 1
         assert len(ingestion.interests) == 1
     
     def test_bulk_data_too_many_purchases(self):
-        purchases = [
-            {
-                "user_id": "user123",
-                "product_id": f"product{i}",
-                "amount": 10.0
-            } for i in range(101)  # 101 purchases (exceeds limit)
-        ]
-        
         with pytest.raises(ValidationError):
-            UserDataIngestion(
-                user={"email": "test@example.com"},
-                purchases=purchases
-            )
+            _INGESTION_ADAPTER.validate_python({
+                "user": {"email": "test@example.com"},
+                "purchases": _oversized_purchases()
+            })
 
 
 class TestValidationUtilities:
@@ -171,15 +187,13 @@ class TestValidationUtilities:
         assert validate_confidence_score(1) == 1.0
     
     def test_validate_confidence_score_invalid(self):
-        from app.core.validation import ValidationError
-        
-        with pytest.raises(ValidationError):
+        with pytest.raises(CoreValidationError):
             validate_confidence_score(1.5)
         
-        with pytest.raises(ValidationError):
+        with pytest.raises(CoreValidationError):
             validate_confidence_score(-0.1)
         
-        with pytest.raises(ValidationError):
+        with pytest.raises(CoreValidationError):
             validate_confidence_score("invalid")
     
     def test_validate_price_valid(self):
@@ -188,15 +202,13 @@ class TestValidationUtilities:
         assert validate_price(0.01) == 0.01
     
     def test_validate_price_invalid(self):
-        from app.core.validation import ValidationError
-        
-        with pytest.raises(ValidationError):
+        with pytest.raises(CoreValidationError):
             validate_price(0)
         
-        with pytest.raises(ValidationError):
+        with pytest.raises(CoreValidationError):
             validate_price(-10.0)
         
-        with pytest.raises(ValidationError):
+        with pytest.raises(CoreValidationError):
             validate_price("invalid")
     
     def test_validate_user_data(self):
@@ -1,167 +1,220 @@
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
+from types import MappingProxyType
+from urllib.parse import urlencode
 from app.models.schemas import ProductCategory
+from tests.conftest import JSON_HEADERS
 
-client = TestClient(app)
+_CAT_ELECTRONICS = ProductCategory.ELECTRONICS.value
+_CAT_CLOTHING = ProductCategory.CLOTHING.value
+_CAT_HOME_GARDEN = ProductCategory.HOME_GARDEN.value
 
+_PRODUCT_URL = "/api/v1/products/{}".format
 
+# Decode response bodies with orjson; Response.json() goes through the stdlib json module
+_loads = orjson.loads
+
+# Read-only payload prototypes; copy with dict(...) or {**...} before changing them
+_BASE_PRODUCT = MappingProxyType({
+    "name": "Test Wireless Headphones",
+    "category": _CAT_ELECTRONICS,
+    "price": 199.99,
+    "description": "High-quality wireless headphones for testing",
+    "image_url": "https://example.com/headphones.jpg",
+    "metadata": {"brand": "TestBrand", "wireless": True}
+})
+
+_PRODUCT_UPDATE = MappingProxyType({
+    "price": 179.99,
+    "description": "Updated description with new features"
+})
+
+_INVALID_PRODUCT = MappingProxyType({
+    "name": "",  # Empty name
+    "category": "invalid_category",
+    "price": -10  # Negative price
+})
+
+_CATALOG_PRODUCTS = (
+    MappingProxyType({
+        "name": "Gaming Laptop",
+        "category": _CAT_ELECTRONICS,
+        "price": 1299.99,
+        "description": "High-performance gaming laptop"
+    }),
+    MappingProxyType({
+        "name": "Cotton T-Shirt",
+        "category": _CAT_CLOTHING,
+        "price": 29.99,
+        "description": "Comfortable cotton t-shirt"
+    }),
+    MappingProxyType({
+        "name": "Coffee Maker",
+        "category": _CAT_HOME_GARDEN,
+        "price": 89.99,
+        "description": "Automatic drip coffee maker"
+    })
+)
+
+_BASE_PRODUCT_BODY = orjson.dumps(dict(_BASE_PRODUCT))
+_PRODUCT_UPDATE_BODY = orjson.dumps(dict(_PRODUCT_UPDATE))
+_INVALID_PRODUCT_BODY = orjson.dumps(dict(_INVALID_PRODUCT))
+_CATALOG_PRODUCT_BODIES = tuple(orjson.dumps(dict(product)) for product in _CATALOG_PRODUCTS)
+
+# Filter query strings are encoded once at import rather than per request; each
+# is paired with the most products the endpoint may return for it
+_DEFAULT_LIMIT = 100
+_PAGE_LIMIT = 5
+_FILTER_CASES = {
+    "category": ("/api/v1/products/?" + urlencode({"category": _CAT_ELECTRONICS}), _DEFAULT_LIMIT),
+    "price_range": ("/api/v1/products/?" + urlencode({"min_price": 100, "max_price": 300}), _DEFAULT_LIMIT),
+    "search": ("/api/v1/products/?" + urlencode({"search": "headphones"}), _DEFAULT_LIMIT),
+    "pagination": ("/api/v1/products/?" + urlencode({"skip": 0, "limit": _PAGE_LIMIT}), _PAGE_LIMIT)
+}
+
+
+@pytest.mark.xdist_group("products")
 class TestProductAPI:
     
-    def test_create_product(self):
-        """Test creating a new product"""
-        product_data = {
-            "name": "Test Wireless Headphones",
-            "category": ProductCategory.ELECTRONICS.value,
-            "price": 199.99,
-            "description": "High-quality wireless headphones for testing",
-            "image_url": "https://example.com/headphones.jpg",
-            "metadata": {"brand": "TestBrand", "wireless": True}
-        }
+    @pytest.fixture
+    def created_product_id(self, client):
+        """Create the base product for a test and delete it afterwards"""
+        response = client.post("/api/v1/products/", content=_BASE_PRODUCT_BODY, headers=JSON_HEADERS)
+        assert response.status_code == 201
+        product_id = _loads(response.content)["id"]
         
-        response = client.post("/api/v1/products/", json=product_data)
+        yield product_id
+        
+        # The test may already have deleted it; a 404 here is fine
+        client.delete(_PRODUCT_URL(product_id))
+    
+    def test_create_product(self, client):
+        """Test creating a new product"""
+        response = client.post("/api/v1/products/", content=_BASE_PRODUCT_BODY, headers=JSON_HEADERS)
         
         assert response.status_code == 201
-        data = response.json()
-        assert data["name"] == "Test Wireless Headphones"
-        assert data["category"] == ProductCategory.ELECTRONICS.value
-        assert data["price"] == 199.99
+        data = _loads(response.content)
+        assert data["name"] == _BASE_PRODUCT["name"]
+        assert data["category"] == _BASE_PRODUCT["category"]
+        assert data["price"] == _BASE_PRODUCT["price"]
         assert "id" in data
-        
-        return data["id"]
     
-    def test_get_products(self):
+    def test_get_products(self, client):
         """Test getting products with default parameters"""
         response = client.get("/api/v1/products/")
         
         assert response.status_code == 200
-        data = response.json()
+        data = _loads(response.content)
         assert isinstance(data, list)
     
-    def test_get_products_with_filters(self):
-        """Test getting products with various filters"""
-        # Test category filter
-        response = client.get(f"/api/v1/products/?category={ProductCategory.ELECTRONICS.value}")
-        assert response.status_code == 200
-        
-        # Test price range filter
-        response = client.get("/api/v1/products/?min_price=100&max_price=300")
-        assert response.status_code == 200
+    @pytest.mark.parametrize("url,max_len", list(_FILTER_CASES.values()), ids=list(_FILTER_CASES))
+    def test_get_products_with_filters(self, client, url, max_len):
+        """Test getting products with each filter"""
+        response = client.get(url)
         
-        # Test search filter
-        response = client.get("/api/v1/products/?search=headphones")
         assert response.status_code == 200
-        
-        # Test pagination
-        response = client.get("/api/v1/products/?skip=0&limit=5")
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) <= 5
+        data = _loads(response.content)
+        assert isinstance(data, list)
+        assert len(data) <= max_len
     
-    def test_get_product_by_id(self):
+    def test_get_product_by_id(self, client, created_product_id):
         """Test getting a specific product by ID"""
-        # Create a product first
-        product_id = self.test_create_product()
+        product_id = created_product_id
         
-        response = client.get(f"/api/v1/products/{product_id}")
+        response = client.get(_PRODUCT_URL(product_id))
         
         assert response.status_code == 200
-        data = response.json()
+        data = _loads(response.content)
         assert data["id"] == product_id
-        assert data["name"] == "Test Wireless Headphones"
+        assert data["name"] == _BASE_PRODUCT["name"]
     
-    def test_get_featured_products(self):
+    def test_get_featured_products(self, client):
         """Test getting featured products"""
         response = client.get("/api/v1/products/featured")
         
         assert response.status_code == 200
-        data = response.json()
+        data = _loads(response.content)
         assert isinstance(data, list)
         assert len(data) <= 20  # Default limit
     
-    def test_get_product_categories(self):
+    def test_get_product_categories(self, client):
         """Test getting available product categories"""
         response = client.get("/api/v1/products/categories")
         
         assert response.status_code == 200
-        data = response.json()
+        data = _loads(response.content)
         assert "categories" in data
         assert isinstance(data["categories"], list)
-        assert ProductCategory.ELECTRONICS.value in data["categories"]
+        assert _CAT_ELECTRONICS in data["categories"]
     
-    def test_update_product(self):
+    def test_update_product(self, client, created_product_id):
         """Test updating a product"""
-        # Create a product first
-        product_id = self.test_create_product()
+        product_id = created_product_id
         
-        update_data = {
-            "price": 179.99,
-            "description": "Updated description with new features"
-        }
-        
-        response = client.put(f"/api/v1/products/{product_id}", json=update_data)
+        response = client.put(
+            _PRODUCT_URL(product_id),
+            content=_PRODUCT_UPDATE_BODY,
+            headers=JSON_HEADERS
+        )
         
         assert response.status_code == 200
-        data = response.json()
-        assert data["price"] == 179.99
+        data = _loads(response.content)
+        assert data["price"] == _PRODUCT_UPDATE["price"]
         assert "Updated description" in data["description"]
     
-    def test_delete_product(self):
+    def test_delete_product(self, client, created_product_id):
         """Test deleting a product"""
-        # Create a product first
-        product_id = self.test_create_product()
+        product_id = created_product_id
         
-        response = client.delete(f"/api/v1/products/{product_id}")
+        response = client.delete(_PRODUCT_URL(product_id))
         
         assert response.status_code == 204
         
         # Verify product is deleted
-        response = client.get(f"/api/v1/products/{product_id}")
+        response = client.get(_PRODUCT_URL(product_id))
         assert response.status_code == 404
     
-    def test_product_not_found(self):
+    def test_product_not_found(self, client):
         """Test getting non-existent product"""
         response = client.get("/api/v1/products/nonexistent-id")
         assert response.status_code == 404
     
-    def test_invalid_product_data(self):
+    def test_invalid_product_data(self, client):
         """Test creating product with invalid data"""
-        invalid_data = {
-            "name": "",  # Empty name
-            "category": "invalid_category",
-            "price": -10  # Negative price
-        }
-        
-        response = client.post("/api/v1/products/", json=invalid_data)
+        response = client.post("/api/v1/products/", content=_INVALID_PRODUCT_BODY, headers=JSON_HEADERS)
         assert response.status_code == 422  # Validation error
     
-    def test_create_multiple_products(self):
+    @pytest.mark.parametrize("body", [
+        b'{"name": "Broken",',  # Malformed JSON
+        b'["not", "an", "object"]',
+        orjson.dumps({**_BASE_PRODUCT, "price": "nineteen"})
+    ])
+    def test_create_product_rejected_body(self, client, body):
+        """Test that bodies ProductCreate rejects get FastAPI's 422 error list"""
+        response = client.post("/api/v1/products/", content=body, headers=JSON_HEADERS)
+        
+        assert response.status_code == 422
+        detail = _loads(response.content)["detail"]
+        assert isinstance(detail, list)
+        assert detail[0]["loc"][0] == "body"
+    
+    def test_create_product_numeric_string_price(self, client):
+        """Test that a numeric string price is coerced like ProductCreate does"""
+        response = client.post(
+            "/api/v1/products/",
+            content=orjson.dumps({**_BASE_PRODUCT, "price": "19.99"}),
+            headers=JSON_HEADERS
+        )
+        
+        assert response.status_code == 201
+        assert _loads(response.content)["price"] == 19.99
+    
+    def test_create_multiple_products(self, client):
         """Test creating multiple products for search/filter testing"""
-        products = [
-            {
-                "name": "Gaming Laptop",
-                "category": ProductCategory.ELECTRONICS.value,
-                "price": 1299.99,
-                "description": "High-performance gaming laptop"
-            },
-            {
-                "name": "Cotton T-Shirt",
-                "category": ProductCategory.CLOTHING.value,
-                "price": 29.99,
-                "description": "Comfortable cotton t-shirt"
-            },
-            {
-                "name": "Coffee Maker",
-                "category": ProductCategory.HOME_GARDEN.value,
-                "price": 89.99,
-                "description": "Automatic drip coffee maker"
-            }
-        ]
-        
-        created_ids = []
-        for product_data in products:
-            response = client.post("/api/v1/products/", json=product_data)
+        created_ids = set()
+        for body in _CATALOG_PRODUCT_BODIES:
+            response = client.post("/api/v1/products/", content=body, headers=JSON_HEADERS)
             assert response.status_code == 201
-            created_ids.append(response.json()["id"])
+            created_ids.add(_loads(response.content)["id"])
         
-        return created_ids
\ No newline at end of file
+        assert len(created_ids) == len(_CATALOG_PRODUCTS)
\ No newline at end of file
@@ -1,162 +1,178 @@
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
 from app.models.schemas import ProductCategory
+from tests.conftest import JSON_HEADERS
 
-client = TestClient(app)
+_CAT_ELECTRONICS = ProductCategory.ELECTRONICS.value
+_CAT_CLOTHING = ProductCategory.CLOTHING.value
 
+# Responses are decoded once per assertion block with orjson rather than httpx's stdlib json
+_loads = orjson.loads
 
+# Bound str.format templates for the per-user recommendation endpoints
+_USER_RECS_URL = "/api/v1/recommendations/users/{}".format
+_CATEGORY_RECS_URL = "/api/v1/recommendations/users/{}/category/{}".format
+_SIMILAR_RECS_URL = "/api/v1/recommendations/users/{}/similar".format
+_INTERACTIONS_URL = "/api/v1/recommendations/users/{}/interactions".format
+
+REC_USER_BODY = orjson.dumps({
+    "email": "rec_test@example.com",
+    "profile_data": {"name": "Test User", "age": 30}
+})
+
+REC_PRODUCT_BODIES = tuple(map(orjson.dumps, [
+    {
+        "name": "Test Smartphone",
+        "category": _CAT_ELECTRONICS,
+        "price": 699.99,
+        "description": "Latest smartphone with great features"
+    },
+    {
+        "name": "Test Laptop",
+        "category": _CAT_ELECTRONICS,
+        "price": 1299.99,
+        "description": "High-performance laptop for professionals"
+    },
+    {
+        "name": "Test T-Shirt",
+        "category": _CAT_CLOTHING,
+        "price": 24.99,
+        "description": "Comfortable cotton t-shirt"
+    }
+]))
+
+
+@pytest.mark.xdist_group("recommendations")
 class TestRecommendationsAPI:
     
-    @pytest.fixture(autouse=True)
-    def setup_test_data(self):
-        """Setup test user and products for recommendations"""
+    @pytest.fixture(scope="class", autouse=True)
+    def setup_test_data(self, request, client):
+        """Setup test user and products shared by all recommendation tests"""
         # Create test user
-        user_data = {
-            "email": "rec_test@example.com",
-            "profile_data": {"name": "Test User", "age": 30}
-        }
-        
-        user_response = client.post("/api/v1/users/", json=user_data)
+        user_response = client.post("/api/v1/users/", content=REC_USER_BODY, headers=JSON_HEADERS)
         assert user_response.status_code == 201
-        self.user_id = user_response.json()["id"]
+        user_id = _loads(user_response.content)["id"]
         
         # Create test products
-        products = [
-            {
-                "name": "Test Smartphone",
-                "category": ProductCategory.ELECTRONICS.value,
-                "price": 699.99,
-                "description": "Latest smartphone with great features"
-            },
-            {
-                "name": "Test Laptop",
-                "category": ProductCategory.ELECTRONICS.value,
-                "price": 1299.99,
-                "description": "High-performance laptop for professionals"
-            },
-            {
-                "name": "Test T-Shirt",
-                "category": ProductCategory.CLOTHING.value,
-                "price": 24.99,
-                "description": "Comfortable cotton t-shirt"
-            }
-        ]
-        
-        self.product_ids = []
-        for product_data in products:
-            response = client.post("/api/v1/products/", json=product_data)
+        product_ids = []
+        for body in REC_PRODUCT_BODIES:
+            response = client.post("/api/v1/products/", content=body, headers=JSON_HEADERS)
             assert response.status_code == 201
-            self.product_ids.append(response.json()["id"])
+            product_ids.append(_loads(response.content)["id"])
         
         # Add some purchase history
         purchase_data = {
             "purchases": [
                 {
-                    "product_id": self.product_ids[0],
+                    "product_id": product_ids[0],
                     "amount": 699.99,
                     "quantity": 1
                 }
             ]
         }
         
-        purchase_response = client.post(f"/api/v1/users/{self.user_id}/data", json=purchase_data)
+        purchase_response = client.post(
+            f"/api/v1/users/{user_id}/data",
+            content=orjson.dumps(purchase_data),
+            headers=JSON_HEADERS
+        )
         assert purchase_response.status_code == 201
+        
+        # Tests only read these; a tuple keeps one test from mutating another's data
+        request.cls.user_id = user_id
+        request.cls.product_ids = tuple(product_ids)
     
-    def test_get_user_recommendations(self):
+    def test_get_user_recommendations(self, client):
         """Test getting personalized recommendations for a user"""
-        response = client.get(f"/api/v1/recommendations/users/{self.user_id}")
+        response = client.get(_USER_RECS_URL(self.user_id))
         
         assert response.status_code == 200
-        data = response.json()
+        data = _loads(response.content)
         assert isinstance(data, list)
         # Note: Recommendations might be empty if Neo4j is not available
         # but the endpoint should not fail
     
-    def test_get_user_recommendations_with_limit(self):
+    def test_get_user_recommendations_with_limit(self, client):
         """Test getting recommendations with custom limit"""
-        response = client.get(f"/api/v1/recommendations/users/{self.user_id}?limit=5")
+        response = client.get(_USER_RECS_URL(self.user_id), params={"limit": 5})
         
         assert response.status_code == 200
-        data = response.json()
+        data = _loads(response.content)
         assert isinstance(data, list)
         assert len(data) <= 5
     
-    def test_get_category_recommendations(self):
+    def test_get_category_recommendations(self, client):
         """Test getting category-specific recommendations"""
-        category = ProductCategory.ELECTRONICS.value
-        response = client.get(f"/api/v1/recommendations/users/{self.user_id}/category/{category}")
+        response = client.get(_CATEGORY_RECS_URL(self.user_id, _CAT_ELECTRONICS))
         
         assert response.status_code == 200
-        data = response.json()
+        data = _loads(response.content)
         assert isinstance(data, list)
     
-    def test_get_similar_user_recommendations(self):
+    def test_get_similar_user_recommendations(self, client):
         """Test getting recommendations based on similar users"""
-        response = client.get(f"/api/v1/recommendations/users/{self.user_id}/similar")
+        response = client.get(_SIMILAR_RECS_URL(self.user_id))
         
         assert response.status_code == 200
-        data = response.json()
+        data = _loads(response.content)
         assert isinstance(data, list)
     
-    def test_get_trending_recommendations(self):
+    def test_get_trending_recommendations(self, client):
         """Test getting trending product recommendations"""
         response = client.get("/api/v1/recommendations/trending")
         
         assert response.status_code == 200
-        data = response.json()
+        data = _loads(response.content)
         assert isinstance(data, list)
     
-    def test_record_recommendation_interaction(self):
+    def test_record_recommendation_interaction(self, client):
         """Test recording user interaction with recommendations"""
         response = client.post(
-            f"/api/v1/recommendations/users/{self.user_id}/interactions"
-            f"?product_id={self.product_ids[0]}&interaction_type=view"
+            _INTERACTIONS_URL(self.user_id),
+            params={"product_id": self.product_ids[0], "interaction_type": "view"}
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = _loads(response.content)
         assert "message" in data
         assert "recorded successfully" in data["message"]
     
-    def test_recommendations_user_not_found(self):
+    def test_recommendations_user_not_found(self, client):
         """Test recommendations for non-existent user"""
-        response = client.get("/api/v1/recommendations/users/nonexistent-user-id")
+        response = client.get(_USER_RECS_URL("nonexistent-user-id"))
         assert response.status_code == 404
     
-    def test_invalid_category_recommendations(self):
+    def test_invalid_category_recommendations(self, client):
         """Test category recommendations with invalid category"""
-        response = client.get(f"/api/v1/recommendations/users/{self.user_id}/category/invalid_category")
+        response = client.get(_CATEGORY_RECS_URL(self.user_id, "invalid_category"))
         assert response.status_code == 422  # Validation error
     
-    def test_recommendations_with_various_limits(self):
+    def test_recommendations_with_various_limits(self, client):
         """Test recommendations with different limit values"""
         # Test minimum limit
-        response = client.get(f"/api/v1/recommendations/users/{self.user_id}?limit=1")
+        response = client.get(_USER_RECS_URL(self.user_id), params={"limit": 1})
         assert response.status_code == 200
-        data = response.json()
+        data = _loads(response.content)
         assert len(data) <= 1
         
         # Test maximum limit
-        response = client.get(f"/api/v1/recommendations/users/{self.user_id}?limit=50")
+        response = client.get(_USER_RECS_URL(self.user_id), params={"limit": 50})
         assert response.status_code == 200
-        data = response.json()
+        data = _loads(response.content)
         assert len(data) <= 50
         
         # Test invalid limit (should use validation)
-        response = client.get(f"/api/v1/recommendations/users/{self.user_id}?limit=0")
+        response = client.get(_USER_RECS_URL(self.user_id), params={"limit": 0})
         assert response.status_code == 422  # Validation error
     
-    def test_record_different_interaction_types(self):
-        """Test recording different types of interactions"""
-        interaction_types = ["view", "click", "purchase"]
+    @pytest.mark.parametrize("interaction_type", ["view", "click", "purchase"])
+    def test_record_different_interaction_types(self, client, interaction_type):
+        """Test recording each type of interaction"""
+        response = client.post(
+            _INTERACTIONS_URL(self.user_id),
+            params={"product_id": self.product_ids[0], "interaction_type": interaction_type}
+        )
         
-        for interaction_type in interaction_types:
-            response = client.post(
-                f"/api/v1/recommendations/users/{self.user_id}/interactions"
-                f"?product_id={self.product_ids[0]}&interaction_type={interaction_type}"
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert "recorded successfully" in data["message"]
\ No newline at end of file
+        assert response.status_code == 200
+        data = _loads(response.content)
+        assert "recorded successfully" in data["message"]
\ No newline at end of file